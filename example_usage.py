@@ -9,7 +9,7 @@ for performing velocity cliff analysis on MLB pitchers.
 import sys
 sys.path.append("utils")
 
-from DataPipeline import DataPipeline
+from DataPipeline import DataPipeline, VELOCITY_ANALYSIS_COLS
 from VelocityCliffAnalyzer import VelocityCliffAnalyzer
 
 def main():
@@ -39,7 +39,7 @@ def main():
     
     # Get player data
     print("\n3. Retrieving player data...")
-    player_data = data_pipeline.get_player_data(player_id, 2024, 2024)
+    player_data = data_pipeline.get_player_data(player_id, 2024, 2024, VELOCITY_ANALYSIS_COLS)
     print(f"   ✓ Retrieved {len(player_data)} pitches")
     
     # Get pitch summary
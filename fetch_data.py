@@ -5,136 +5,450 @@ Practical Data Download Script
 This script downloads the required data files for the Velocity Cliff Analysis app
 using pybaseball. It creates the proper directory structure and downloads
 both player metadata and season data.
+
+Season data is requested in month-sized windows on a small thread pool,
+throttled to stay under the baseball-reference/Savant rate limits, and each
+month is appended to the season's feather file as soon as it arrives. If
+requests-cache is installed, HTTP responses are cached on disk so re-runs
+do not hit the network again.
+
+With --dataset, each season is also written into a Hive-partitioned feather
+dataset at data/savant/season_data_ds/game_year=YYYY/, so pyarrow.dataset
+readers can filter on game_year and open only the requested seasons.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import os
 import sys
+import argparse
+import calendar
+import functools
+import importlib
+import importlib.util
+import logging
+import shutil
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils"))
+from SeasonFiles import list_season_files
+
+log = logging.getLogger("analytico.download")
+
+# Data file locations (relative to the project root)
+DATA_DIR = Path("data")
+PLAYER_META = DATA_DIR / "player_meta.feather"
+SEASON_DIR = DATA_DIR / "savant" / "season_data"
+SEASON_DIR_STR = os.fspath(SEASON_DIR)
+SEASON_DATASET_DIR = DATA_DIR / "savant" / "season_data_ds"
+
+# Concurrent statcast requests and the shared request rate (requests/second)
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 0.5
+
+# Player metadata younger than this (seconds) is reused instead of re-downloaded
+PLAYER_META_MAX_AGE = 7 * 86400
+
+# Rows per Arrow record batch when streaming a season to disk
+BATCH_ROWS = 64_000
+
+# String columns with fewer distinct values than this in the first month are
+# dictionary-encoded (pitch_type, events, description, ...)
+DICTIONARY_MAX_VALUES = 2048
+
+# Season files are written as Zstd-compressed Feather V2. Dictionaries grow as
+# months are streamed in, so they are written as delta batches; pyarrow reads
+# these, but Polars' scan_ipc does not (migrate_feather.py rewrites a season
+# with unified dictionaries)
+WRITE_OPTIONS = pa.ipc.IpcWriteOptions(
+    compression=pa.Codec("zstd", compression_level=3),
+    emit_dictionary_deltas=True
+)
+
+# Partitioning of the optional multi-season dataset written with --dataset
+SEASON_DATASET_PARTITIONING = ds.partitioning(pa.schema([("game_year", pa.int16())]), flavor="hive")
+
+class RateLimiter:
+    """Space out calls so that at most `rate` requests start per second across all threads."""
+    
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_time = time.monotonic()
+    
+    def wait(self):
+        """Block until the caller is allowed to issue its request."""
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+def month_windows(year):
+    """Yield (start_date, end_date) strings covering each month of `year`."""
+    for month in range(1, 13):
+        last_day = calendar.monthrange(year, month)[1]
+        yield f'{year}-{month:02d}-01', f'{year}-{month:02d}-{last_day:02d}'
+
+@functools.lru_cache(maxsize=1)
+def lookup_all_players():
+    """Fetch the full player register once per process."""
+    from pybaseball import playerid_lookup
+    return playerid_lookup('', '')
+
+def dictionary_columns(table):
+    """Return the string columns of `table` with few enough distinct values to dictionary-encode."""
+    return [
+        field.name for field in table.schema
+        if (pa.types.is_string(field.type) or pa.types.is_large_string(field.type))
+        and pc.count_distinct(table.column(field.name)).as_py() < DICTIONARY_MAX_VALUES
+    ]
+
+def encode_dictionaries(table, dictionaries):
+    """
+    Dictionary-encode columns of `table` against running per-column dictionaries.
+    
+    Values not seen in earlier months are appended to the column's dictionary,
+    so dictionaries only grow and the IPC writer can emit them as deltas.
+    """
+    for name, known in dictionaries.items():
+        index = table.schema.get_field_index(name)
+        values = table.column(index)
+        unseen = pc.unique(pc.drop_null(values.filter(pc.invert(pc.is_in(values, value_set=known)))))
+        if len(unseen):
+            known = pa.concat_arrays([known, unseen])
+            dictionaries[name] = known
+        
+        indices = pc.index_in(values, value_set=known)
+        encoded = pa.chunked_array(
+            [pa.DictionaryArray.from_arrays(chunk, known) for chunk in indices.chunks],
+            type=pa.dictionary(pa.int32(), known.type)
+        )
+        table = table.set_column(index, name, encoded)
+    return table
+
+def widen_dictionaries(dictionaries, old_schema, schema, table):
+    """
+    Bring the running dictionaries in line with a widened season schema.
+    
+    Dictionaries whose column was promoted (e.g. string to large_string) are
+    cast to the new value type. String columns that were all-null until this
+    month (or absent until now) are dictionary-encoded from now on if
+    `table` has few enough distinct values in them.
+    """
+    for name, known in dictionaries.items():
+        value_type = schema.field(name).type
+        if known.type != value_type:
+            dictionaries[name] = known.cast(value_type)
+    
+    newly_typed = [
+        name for name in table.column_names
+        if name not in dictionaries
+        and (old_schema.get_field_index(name) < 0 or pa.types.is_null(old_schema.field(name).type))
+    ]
+    if newly_typed:
+        for name in dictionary_columns(table.select(newly_typed)):
+            dictionaries[name] = pa.array([], type=schema.field(name).type)
+
+def conform_to_schema(table, schema, dictionaries=None):
+    """
+    Cast the columns of `table` to `schema`, with nulls for any column it lacks.
+    
+    A dictionary-encoded column that `table` lacks or has only nulls in is
+    filled with null indices into its running dictionary from `dictionaries`.
+    An empty dictionary can't be used here: the IPC writer only emits later
+    dictionaries as deltas if the first one it saw is non-empty.
+    """
+    columns = []
+    for field in schema:
+        column = table.column(field.name) if field.name in table.column_names else None
+        if pa.types.is_dictionary(field.type) and (column is None or pa.types.is_null(column.type)):
+            indices = pa.nulls(table.num_rows, field.type.index_type)
+            columns.append(pa.DictionaryArray.from_arrays(indices, dictionaries[field.name]))
+        elif column is None:
+            columns.append(pa.nulls(table.num_rows, field.type))
+        else:
+            columns.append(column.cast(field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+def rewrite_season_part(part_file, new_file, schema, dictionaries):
+    """
+    Copy the batches written so far to `new_file` under a widened schema.
+    
+    Batches are read back and cast one at a time, so this costs one pass over
+    the months already written but never holds more than a batch. Columns that
+    became dictionary-encoded with the widening are written as null indices
+    into their dictionary in `dictionaries`. Returns the open writer for
+    `new_file`; `part_file` is removed.
+    """
+    writer = pa.ipc.new_file(str(new_file), schema, options=WRITE_OPTIONS)
+    try:
+        with pa.memory_map(str(part_file), "r") as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = pa.Table.from_batches([reader.get_batch(i)])
+                writer.write_table(conform_to_schema(batch, schema, dictionaries))
+    except BaseException:
+        writer.close()
+        new_file.unlink(missing_ok=True)
+        raise
+    part_file.unlink()
+    return writer
+
+def drain_results(futures):
+    """
+    Yield the results of a deque of futures in order.
+    
+    Each future is removed from the deque before its result is handed over,
+    so a result is released as soon as the consumer is done with it.
+    """
+    while futures:
+        yield futures.popleft().result()
+
+def write_season(months, output_file):
+    """
+    Stream monthly statcast frames into a feather (Arrow IPC) file.
+    
+    The writer is opened from the first non-empty month's schema and every
+    month is written as record batches, so only one month is held in memory
+    at a time. Low-cardinality string columns are dictionary-encoded and the
+    file is Zstd-compressed. The file is written under a temporary name and
+    only moved into place once the whole season has been written.
+    
+    Statcast has sparse columns that can be all-null in an early month and
+    typed later, and integer columns that gain missing values. When a month
+    does not fit the schema so far, the schema is widened (null to the concrete
+    type, int64 to double, new columns added) and the months already written
+    are copied into a new file under it.
+    
+    Returns:
+        int: Number of rows written (0 if every month was empty)
+    """
+    part_file = output_file.with_name(output_file.name + ".part")
+    writer = None
+    schema = None
+    dictionaries = {}
+    rows = 0
+    widenings = 0
+    
+    try:
+        for month in months:
+            if month.empty:
+                continue
+            
+            table = pa.Table.from_pandas(month, preserve_index=False)
+            rewrite = False
+            if schema is None:
+                schema = table.schema
+                dictionaries = {
+                    name: pa.array([], type=schema.field(name).type)
+                    for name in dictionary_columns(table)
+                }
+            else:
+                widened = pa.unify_schemas([schema, table.schema], promote_options="permissive")
+                if not widened.equals(schema):
+                    old_schema, schema = schema, widened.with_metadata(schema.metadata)
+                    widen_dictionaries(dictionaries, old_schema, schema, table)
+                    rewrite = writer is not None
+                table = conform_to_schema(table, schema)
+            table = encode_dictionaries(table, dictionaries)
+            
+            # The months already written are rewritten after this month is
+            # encoded, so newly encoded columns have a non-empty dictionary
+            if rewrite:
+                widenings += 1
+                new_file = output_file.with_name(f"{output_file.name}.part{widenings}")
+                writer.close()
+                writer = None
+                writer = rewrite_season_part(part_file, new_file, table.schema, dictionaries)
+                part_file = new_file
+            
+            if writer is None:
+                writer = pa.ipc.new_file(str(part_file), table.schema, options=WRITE_OPTIONS)
+            for batch in table.to_batches(max_chunksize=BATCH_ROWS):
+                writer.write_batch(batch)
+            rows += table.num_rows
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        part_file.unlink(missing_ok=True)
+        raise
+    
+    if writer is not None:
+        writer.close()
+        os.replace(part_file, output_file)
+    return rows
+
+def write_season_partition(season_file, dataset_dir, year):
+    """
+    Copy a season feather file into the game_year=YYYY partition of the season dataset.
+    
+    The season file is streamed batch by batch, so the season is never held in
+    memory as a whole. The year's partition is replaced, so pitches dropped
+    from the season file don't linger.
+    """
+    partition_dir = dataset_dir / f"game_year={year}"
+    if partition_dir.exists():
+        shutil.rmtree(partition_dir)
+    
+    ds.write_dataset(
+        ds.dataset(str(season_file), format="feather"), str(dataset_dir), format="feather",
+        partitioning=SEASON_DATASET_PARTITIONING, basename_template="part-{i}.feather",
+        file_options=ds.IpcFileFormat().make_write_options(compression="zstd"),
+        existing_data_behavior="overwrite_or_ignore"
+    )
+
+def enable_http_cache(data_dir):
+    """Install a persistent requests cache (must run before pybaseball is imported)."""
+    try:
+        import requests_cache
+    except ImportError:
+        log.info("ℹ️  requests-cache not installed, HTTP responses will not be cached")
+        return
+    
+    requests_cache.install_cache(
+        str(data_dir / ".http_cache"), backend="sqlite", expire_after=86400
+    )
+    log.info("✅ HTTP cache enabled")
+
 def main():
     """Download data files using pybaseball."""
     
-    print("⚾ Velocity Cliff Analysis - Data Download")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description='Download the Velocity Cliff Analysis data files')
+    parser.add_argument('--dataset', action='store_true',
+                        help='Also write the seasons into a Hive-partitioned dataset at '
+                             'data/savant/season_data_ds/game_year=YYYY/')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
+    log.info("⚾ Velocity Cliff Analysis - Data Download\n%s", "=" * 50)
+    
+    # Create directories
+    log.info("\n📁 Creating directory structure...")
+    SEASON_DIR.mkdir(parents=True, exist_ok=True)
+    log.info("✅ Directories created")
+    
+    # Cache HTTP responses before pybaseball creates its sessions
+    enable_http_cache(DATA_DIR)
     
     # Check if pybaseball is installed
-    try:
-        from pybaseball import statcast, playerid_lookup
-        print("✅ pybaseball is installed")
-    except ImportError:
-        print("❌ pybaseball not found. Installing...")
-        os.system("pip install pybaseball")
+    if importlib.util.find_spec("pybaseball") is None:
+        log.warning("❌ pybaseball not found. Installing...")
         try:
-            from pybaseball import statcast, playerid_lookup
-            print("✅ pybaseball installed successfully")
-        except ImportError:
-            print("❌ Failed to install pybaseball")
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input", "pybaseball>=2.2"
+            ])
+        except subprocess.CalledProcessError as e:
+            log.error(f"❌ Failed to install pybaseball: {e}")
             return
+        importlib.invalidate_caches()
+        log.info("✅ pybaseball installed successfully")
+    else:
+        log.info("✅ pybaseball is installed")
     
-    # Create directories
-    print("\n📁 Creating directory structure...")
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    season_dir = data_dir / "savant" / "season_data"
-    season_dir.mkdir(parents=True, exist_ok=True)
-    print("✅ Directories created")
+    from pybaseball import statcast
     
     # Download player metadata
-    print("\n👥 Downloading player metadata...")
+    log.info("\n👥 Downloading player metadata...")
     try:
-        # Get all players from recent years to build metadata
-        all_players = []
-        for year in [2024, 2023, 2022]:
-            print(f"  Fetching {year} player data...")
-            try:
-                players = playerid_lookup('', '')  # Get all players
-                if not players.empty:
-                    players['year'] = year
-                    all_players.append(players)
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                print(f"  Warning: Could not fetch {year} players: {e}")
-        
-        if all_players:
-            player_meta = pd.concat(all_players, ignore_index=True)
-            player_meta = player_meta.drop_duplicates(subset=['key_mlbam']).reset_index(drop=True)
+        if PLAYER_META.exists() and time.time() - PLAYER_META.stat().st_mtime < PLAYER_META_MAX_AGE:
+            player_meta = pd.read_feather(PLAYER_META)
+            log.info(f"✅ Using cached player metadata ({len(player_meta)} players)")
+        else:
+            players = lookup_all_players()  # Get all players
+            if players.empty:
+                log.error("❌ Could not download player metadata")
+                return
+            
+            player_meta = players.drop_duplicates(subset=['key_mlbam']).reset_index(drop=True)
             
             # Save player metadata
-            player_meta.to_feather(data_dir / "player_meta.feather")
-            print(f"✅ Player metadata saved ({len(player_meta)} players)")
-        else:
-            print("❌ Could not download player metadata")
-            return
+            player_meta.to_feather(PLAYER_META)
+            log.info(f"✅ Player metadata saved ({len(player_meta)} players)")
             
     except Exception as e:
-        print(f"❌ Error downloading player metadata: {e}")
+        log.error(f"❌ Error downloading player metadata: {e}")
         return
     
     # Download season data
-    print("\n📊 Downloading season data...")
+    log.info("\n📊 Downloading season data...")
     years = [2024, 2023, 2022]  # Start with recent years
     
-    for year in years:
-        print(f"\n📅 Downloading {year} data...")
-        try:
-            # Download full season data
-            data = statcast(f'{year}-01-01', f'{year}-12-31')
-            
-            if not data.empty:
-                # Save to feather format
-                output_file = season_dir / f"{year}.feather"
-                data.to_feather(output_file)
+    limiter = RateLimiter(REQUESTS_PER_SECOND)
+    
+    def fetch_month(start_date, end_date):
+        limiter.wait()
+        return statcast(start_date, end_date)
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for year in years:
+            log.info(f"\n📅 Downloading {year} data...")
+            try:
+                # Download the season one month at a time
+                futures = deque(
+                    executor.submit(fetch_month, start_date, end_date)
+                    for start_date, end_date in month_windows(year)
+                )
                 
-                size_mb = output_file.stat().st_size / (1024 * 1024)
-                print(f"✅ {year} data saved ({len(data):,} pitches, {size_mb:.1f}MB)")
-            else:
-                print(f"⚠️  No data found for {year}")
+                # Write each month to the feather file as it arrives
+                output_file = SEASON_DIR / f"{year}.feather"
+                rows = write_season(drain_results(futures), output_file)
                 
-        except Exception as e:
-            print(f"❌ Error downloading {year}: {e}")
-        
-        # Rate limiting
-        if year != years[-1]:  # Don't sleep after last year
-            print("  Waiting 5 seconds for rate limiting...")
-            time.sleep(5)
+                if rows:
+                    size_mb = output_file.stat().st_size / (1024 * 1024)
+                    log.info(f"✅ {year} data saved ({rows:,} pitches, {size_mb:.1f}MB)")
+                    
+                    if args.dataset:
+                        write_season_partition(output_file, SEASON_DATASET_DIR, year)
+                        log.info(f"✅ {year} added to the season dataset")
+                else:
+                    log.warning(f"⚠️  No data found for {year}")
+                    
+            except Exception as e:
+                log.error(f"❌ Error downloading {year}: {e}")
     
-    print("\n🎉 Download complete!")
-    print("\n📋 Summary:")
+    log.info("\n🎉 Download complete!\n\n📋 Summary:")
     
     # Check what was downloaded
     check_downloaded_files()
     
-    print("\n🚀 You can now run the Streamlit app:")
-    print("   streamlit run streamlit_app.py")
+    log.info("\n🚀 You can now run the Streamlit app:\n   streamlit run streamlit_app.py")
 
 def check_downloaded_files():
     """Check what files were successfully downloaded."""
     
-    data_dir = Path("data")
+    lines = []
     
     # Check player metadata
-    player_meta = data_dir / "player_meta.feather"
-    if player_meta.exists():
-        size_mb = player_meta.stat().st_size / (1024 * 1024)
-        print(f"✅ player_meta.feather ({size_mb:.1f}MB)")
+    if PLAYER_META.exists():
+        size_mb = PLAYER_META.stat().st_size / (1024 * 1024)
+        lines.append(f"✅ player_meta.feather ({size_mb:.1f}MB)")
     else:
-        print("❌ player_meta.feather (missing)")
+        lines.append("❌ player_meta.feather (missing)")
     
     # Check season data
-    season_dir = data_dir / "savant" / "season_data"
-    if season_dir.exists():
-        feather_files = list(season_dir.glob("*.feather"))
+    if SEASON_DIR.exists():
+        feather_files = list_season_files(SEASON_DIR_STR)
         if feather_files:
-            print(f"✅ Season data: {len(feather_files)} files")
-            total_size = sum(f.stat().st_size for f in feather_files) / (1024 * 1024)
-            print(f"   Total size: {total_size:.1f}MB")
-            for file in sorted(feather_files):
-                size_mb = file.stat().st_size / (1024 * 1024)
-                print(f"   - {file.name} ({size_mb:.1f}MB)")
+            lines.append(f"✅ Season data: {len(feather_files)} files")
+            total_size = sum(size for _, size in feather_files) / (1024 * 1024)
+            lines.append(f"   Total size: {total_size:.1f}MB")
+            for name, size in feather_files:
+                lines.append(f"   - {name} ({size / (1024 * 1024):.1f}MB)")
         else:
-            print("❌ No season data files found")
+            lines.append("❌ No season data files found")
+    
+    log.info("\n".join(lines))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,5 +1,7 @@
+from types import MappingProxyType
+
 # MLB HEX color codes (only primary colors are used)
-team_colors = {
+team_colors = MappingProxyType({
     "ATL": "#CE1141",
     "BAL": "#DF4601",
     "BOS": "#BD3039",
@@ -24,15 +26,15 @@ team_colors = {
     "SDP": "#2F241D",
     "SFG": "#FD5A1E",
     "SEA": "#0C2C56",
-    "STL" "#C41E3A",
+    "STL": "#C41E3A",
     "TBR": "#092C5C",
     "TEX": "#003278",
     "TOR": "#134A8E",
     "WSN": "#AB0003"
-}
+})
 
 # Teams that became current franchises with their current names
-relocated_teams = {
+relocated_teams = MappingProxyType({
     "BSN": "ATL",
     "St. Louis Browns": "BAL",
     "Philadelphia Athletics": "Oakland Athletics",
@@ -44,35 +46,69 @@ relocated_teams = {
     "Seattle Pilots": "Milwaukee Brewers",
     "Washington Senators (1961)": "Texas Rangers",
     "Montreal Expos": "Washington Nationals"
-}
+})
+
+# Abbreviations of current franchises referred to by full name above
+name_to_abbr = MappingProxyType({
+    "Oakland Athletics": "OAK",
+    "Los Angeles Dodgers": "LAD",
+    "Minnesota Twins": "MIN",
+    "Milwaukee Brewers": "MIL",
+    "Texas Rangers": "TEX",
+    "Washington Nationals": "WSN"
+})
 
 # Any defunct teams will be colored grey
 defunct_color = "#808080"
 
-# Dictionary to hold defunct teams
-defunct_teams = [
+# Set of defunct teams
+defunct_teams = frozenset([
     "Louisville Colonels", "BAL (NL)", "Cleveland Spiders", 
     "Washington Senators (NL)", "Indianapolis Hoosiers", "Kansas City Packers", 
     "Chicago Whales", "Baltimore Terrapins", "St. Louis Terriers", 
     "Brooklyn Tip-Tops", "Pittsburgh Rebels", "Buffalo Blues", "Newark Peppers"
-]
+])
+
+# Precomputed color for each team in the plot based on its current status.
+# Relocated teams take the color of the franchise they became; defunct teams
+# (and teams without a current franchise) are grey.
+team_color_map = MappingProxyType({
+    "Boston Braves": "#808080",
+    "St. Louis Browns": "#DF4601",
+    "Philadelphia Athletics": "#003831",
+    "New York Giants": "#FD5A1E",
+    "Brooklyn Dodgers": "#005A9C",
+    "Washington Senators": "#002B5C",
+    "Milwaukee Braves": "#CE1141",
+    "Kansas City Athletics": "#003831",
+    "Seattle Pilots": "#12284B",
+    "Montreal Expos": "#AB0003",
+    "Louisville Colonels": "#808080",
+    "Cleveland Spiders": "#808080",
+    "BAL (NL)": "#808080",
+    "Washington Senators (NL)": "#808080",
+    "Indianapolis Hoosiers": "#808080",
+    "Kansas City Packers": "#808080",
+    "Chicago Whales": "#808080",
+    "Baltimore Terrapins": "#808080",
+    "St. Louis Terriers": "#808080",
+    "Brooklyn Tip-Tops": "#808080",
+    "Pittsburgh Rebels": "#808080",
+    "Buffalo Blues": "#808080",
+    "Newark Peppers": "#808080"
+})
 
-# Data of teams for the plot
-teams = [
-    "Boston Braves", "St. Louis Browns", "Philadelphia Athletics", 
-    "New York Giants", "Brooklyn Dodgers", "Washington Senators", 
-    "Milwaukee Braves", "Kansas City Athletics", "Seattle Pilots", 
-    "Montreal Expos", "Louisville Colonels", "Cleveland Spiders"
-] + defunct_teams
 
-# Generate a color for each team based on their current status
-team_color_map = {}
+def team_color(team):
+    """
+    Look up the plot color for a current abbreviation or historical team name.
 
-for team in teams:
+    Relocated teams take the color of the franchise they became (resolving full
+    franchise names through name_to_abbr); defunct and unknown teams are grey.
+    """
     if team in defunct_teams:
-        team_color_map[team] = defunct_color
-    elif team in relocated_teams:
+        return defunct_color
+    if team in relocated_teams:
         current_team = relocated_teams[team]
-        team_color_map[team] = team_colors[current_team]
-    else:
-        team_color_map[team] = team_colors.get(team, defunct_color)
+        return team_colors.get(name_to_abbr.get(current_team, current_team), defunct_color)
+    return team_colors.get(team, defunct_color)
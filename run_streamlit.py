@@ -7,16 +7,19 @@ import subprocess
 import sys
 import os
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils"))
+from Requirements import missing_requirements
+
 def main():
     """Launch the Streamlit app."""
     
-    # Check if streamlit is installed
-    try:
-        import streamlit
-        print("✅ Streamlit is installed")
-    except ImportError:
-        print("❌ Streamlit not found. Installing dependencies...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    # Check installed package versions without importing them
+    missing = missing_requirements("requirements.txt")
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}. Installing...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+    else:
+        print("✅ Dependencies are installed")
     
     # Set environment variables for better performance
     os.environ["STREAMLIT_SERVER_PORT"] = "8501"
@@ -10,6 +10,9 @@ import sys
 import os
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils"))
+from Requirements import missing_requirements
+
 def main():
     """Main setup function."""
     
@@ -26,13 +29,17 @@ def main():
         print(f"✅ Python {python_version.major}.{python_version.minor} detected")
     
     # Install dependencies
-    print("\n📦 Installing dependencies...")
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        print("✅ Dependencies installed successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error installing dependencies: {e}")
-        return
+    missing = missing_requirements("requirements.txt")
+    if missing:
+        print(f"\n📦 Installing dependencies: {', '.join(missing)}")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+            print("✅ Dependencies installed successfully")
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Error installing dependencies: {e}")
+            return
+    else:
+        print("\n✅ Dependencies already installed")
     
     # Check if data files exist
     data_dir = Path("data")
@@ -9,9 +9,6 @@ import streamlit as st
 import sys
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import datetime
 
 # Add utils to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,7 +18,6 @@ else:
     sys.path.append("utils")
 
 from DataPipeline import DataPipeline
-from VelocityCliffAnalyzer import VelocityCliffAnalyzer
 
 # Page configuration
 st.set_page_config(
@@ -56,6 +52,27 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def load_data_pipeline():
+    """Load and cache the data pipeline."""
+    try:
+        pipeline = DataPipeline()
+        return pipeline, None
+    except Exception as e:
+        return None, str(e)
+
+@st.cache_data(show_spinner=False)
+def _cached_analysis(player_name, start_year, end_year, pitch_type, generate_plots,
+                     full_resolution=False):
+    """Run the full analysis once per distinct query and reuse the results on repeat runs."""
+    # Imported here so reruns that don't run an analysis skip loading the analyzer
+    from VelocityCliffAnalyzer import VelocityCliffAnalyzer
+    
+    analyzer = VelocityCliffAnalyzer(load_data_pipeline()[0], full_resolution=full_resolution)
+    return analyzer.run_full_analysis(
+        player_name, start_year, end_year, pitch_type, generate_plots
+    )
+
 def main():
     """Main Streamlit app function."""
     
@@ -71,15 +88,6 @@ def main():
     """, unsafe_allow_html=True)
     
     # Initialize data pipeline
-    @st.cache_resource
-    def load_data_pipeline():
-        """Load and cache the data pipeline."""
-        try:
-            pipeline = DataPipeline()
-            return pipeline, None
-        except Exception as e:
-            return None, str(e)
-    
     data_pipeline, error = load_data_pipeline()
     
     # Handle missing data files
@@ -134,6 +142,12 @@ def main():
             value=False,
             help="Enable to show velocity vs performance plots"
         )
+        full_resolution = st.checkbox(
+            "Full-resolution scatter",
+            value=False,
+            disabled=not generate_plots,
+            help="Plot every pitch instead of binned velocity averages (slower for large samples)"
+        )
         
         # Run analysis button
         st.markdown("---")
@@ -147,12 +161,10 @@ def main():
     if run_analysis and player_name:
         with st.spinner("Running velocity cliff analysis..."):
             try:
-                # Initialize analyzer
-                analyzer = VelocityCliffAnalyzer(data_pipeline)
-                
-                # Run analysis
-                results = analyzer.run_full_analysis(
-                    player_name, start_year, end_year, pitch_type, generate_plots
+                # Run analysis (cached per player, years, pitch type and plot option)
+                results = _cached_analysis(
+                    player_name, start_year, end_year, pitch_type, generate_plots,
+                    full_resolution
                 )
                 
                 if 'error' in results:
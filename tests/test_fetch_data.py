@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from fetch_data import write_season
+
+
+class WriteSeasonTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_file = Path(self.tmp_dir.name) / '2024.feather'
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_season(self):
+        with pa.memory_map(str(self.output_file), 'r') as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    def test_null_then_typed_column(self):
+        months = [
+            pd.DataFrame({'pitch_type': ['FF', 'SL'], 'release_speed': [95.1, 86.0],
+                          'sv_id': [None, None]}),
+            pd.DataFrame({'pitch_type': ['FF', 'CH'], 'release_speed': [94.2, 88.5],
+                          'sv_id': ['240401_190000', '240401_190005']}),
+            pd.DataFrame({'pitch_type': ['SL'], 'release_speed': [85.7], 'sv_id': ['240502_180000']}),
+        ]
+
+        rows = write_season(iter(months), self.output_file)
+
+        self.assertEqual(rows, 5)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ['2024.feather'])
+        season = self.read_season()
+        self.assertEqual(season['pitch_type'].tolist(), ['FF', 'SL', 'FF', 'CH', 'SL'])
+        self.assertTrue(season['sv_id'].iloc[:2].isna().all())
+        self.assertEqual(season['sv_id'].tolist()[2:],
+                         ['240401_190000', '240401_190005', '240502_180000'])
+
+    def test_null_then_typed_column_is_dictionary_encoded(self):
+        months = [
+            pd.DataFrame({'pitch_type': ['FF', 'SL'], 'if_fielding_alignment': [None, None]}),
+            pd.DataFrame({'pitch_type': ['FF', 'SL'], 'if_fielding_alignment': ['Standard', 'Strategic']}),
+            pd.DataFrame({'pitch_type': ['CU'], 'if_fielding_alignment': ['Infield shift']}),
+        ]
+
+        self.assertEqual(write_season(iter(months), self.output_file), 5)
+        with pa.memory_map(str(self.output_file), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('pitch_type').type))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('if_fielding_alignment').type))
+        self.assertEqual(table.column('if_fielding_alignment').to_pylist(),
+                         [None, None, 'Standard', 'Strategic', 'Infield shift'])
+
+    def test_integer_column_gains_missing_values(self):
+        months = [
+            pd.DataFrame({'pitcher': [1, 2], 'zone': [5, 11]}),
+            pd.DataFrame({'pitcher': [3, 4], 'zone': [None, 3.0]}),
+        ]
+
+        self.assertEqual(write_season(iter(months), self.output_file), 4)
+        season = self.read_season()
+        self.assertEqual(season['zone'].tolist()[:2], [5.0, 11.0])
+        self.assertTrue(pd.isna(season['zone'].iloc[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+from typing import List
+import pyarrow as pa
+
+def concat_season_tables(tables: List[pa.Table]) -> pa.Table:
+    """
+    Concatenate per-season Arrow tables whose schemas may have drifted.
+
+    Seasons written at different times can disagree on a column's type: a
+    column added in a later season, string vs large_string, or dictionary
+    encoded in one file and plain in another. Dictionary columns whose types
+    disagree are decoded first, then the tables are concatenated with
+    permissive promotion (missing columns become nulls, types are widened).
+
+    Args:
+        tables (List[pa.Table]): Tables to concatenate, in order.
+
+    Returns:
+        pa.Table: The concatenated table.
+    """
+    types = {}
+    for table in tables:
+        for field in table.schema:
+            types.setdefault(field.name, set()).add(field.type)
+    mixed = {name for name, seen in types.items() if len(seen) > 1}
+
+    if mixed:
+        decoded = []
+        for table in tables:
+            for index, field in enumerate(table.schema):
+                if field.name in mixed and pa.types.is_dictionary(field.type):
+                    table = table.set_column(
+                        index, field.name, table.column(index).cast(field.type.value_type)
+                    )
+            decoded.append(table)
+        tables = decoded
+
+    return pa.concat_tables(tables, promote_options='permissive')
@@ -1,8 +1,230 @@
 import os
+import re
+import functools
+import tempfile
+import zipfile
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Tuple
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import feather
+from typing import Optional, List, Dict, Tuple, Union
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from ArrowTables import concat_season_tables
+
+# Configure logging once at import, unless the application already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+
+_SEASON_FILE = re.compile(r'(\d{4})\.(?:parquet|feather)')
+
+# Columns read by the velocity cliff analysis (CUSUM, Bayesian changepoint and plots)
+VELOCITY_ANALYSIS_COLS = ['release_speed', 'estimated_woba_using_speedangle', 'pitch_type', 'delta_run_exp']
+
+# Columns kept in the per-pitcher aggregate written by utils/build_pitcher_agg.py
+# to data/pitcher_agg/pitcher=ID/, covering every season
+PITCHER_AGG_COLS = ['game_year', *VELOCITY_ANALYSIS_COLS]
+
+# Velocity resolution (mph) of prepare_velocity_analysis_data(bucketize=True)
+BUCKET_WIDTH_MPH = 0.1
+
+# Upper bound on seasons read concurrently by get_player_data
+MAX_LOAD_WORKERS = 8
+
+# Compact dtypes for the columns the analysis reads most
+_COMPACT_DTYPES = {
+    'release_speed': 'float32',
+    'estimated_woba_using_speedangle': 'float32',
+    'delta_run_exp': 'float32',
+    'pitch_type': 'category',
+}
+
+@functools.lru_cache(maxsize=2)
+def _load_table(path: str, mtime_ns: int) -> pa.Table:
+    """
+    Read the player metadata feather file as an Arrow table.
+    
+    Cached on (path, mtime_ns) so every pipeline shares the decoded table
+    while a rewritten file is picked up automatically. Season files are not
+    cached here: a decompressed season is hundreds of MB, see _read_columns.
+    """
+    return _read_columns(path)
+
+def _read_columns(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Read some columns of a feather file as an Arrow table (default: all columns).
+    
+    Columns missing from the file are skipped. Only the selected columns of a
+    compressed file are decompressed. Files are memory-mapped, so uncompressed
+    buffers are served from the OS page cache rather than copied onto the
+    Python heap.
+    """
+    source = pa.memory_map(path, 'r')
+    try:
+        reader = pa.ipc.open_file(source)
+    except pa.ArrowInvalid:
+        # Feather V1 files are not Arrow IPC files
+        table = feather.read_table(path)
+        if columns is None:
+            return table
+        return table.select([c for c in columns if c in table.schema.names])
+    if columns is not None:
+        included = sorted({reader.schema.get_field_index(c) for c in columns} - {-1})
+        reader = pa.ipc.open_file(source, options=pa.ipc.IpcReadOptions(included_fields=included))
+    return reader.read_all()
+
+@functools.lru_cache(maxsize=4)
+def _load_frame(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Convert a cached feather table to pandas once per (path, mtime_ns)."""
+    return _load_table(path, mtime_ns).to_pandas()
+
+# Columns the get_player_data row filter can refer to
+_PREDICATE_COLS = ['pitcher', 'game_year', 'pitch_type']
+
+# Columns aggregated by get_pitch_summary, in output order
+_SUMMARY_COLS = ['release_speed', 'estimated_woba_using_speedangle', 'delta_run_exp']
+
+@functools.lru_cache(maxsize=None)
+def _summary_kernel():
+    """
+    Compile the get_pitch_summary kernel on first use, or None without numba.
+    
+    numba is imported here rather than at module import, so entry points that
+    never summarize pitches don't pay for loading it.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def kernel(codes, values, n_groups):
+        """
+        Per-group count/mean/M2/min/max of each value column in one pass.
+        
+        Uses Welford's update for the running variance; NaN values and rows
+        with a negative (missing) group code are skipped.
+        """
+        n_cols = values.shape[1]
+        count = np.zeros((n_groups, n_cols))
+        mean = np.zeros((n_groups, n_cols))
+        m2 = np.zeros((n_groups, n_cols))
+        vmin = np.full((n_groups, n_cols), np.inf)
+        vmax = np.full((n_groups, n_cols), -np.inf)
+        for j in prange(n_cols):
+            for i in range(len(codes)):
+                g = codes[i]
+                x = values[i, j]
+                if g < 0 or np.isnan(x):
+                    continue
+                count[g, j] += 1
+                delta = x - mean[g, j]
+                mean[g, j] += delta / count[g, j]
+                m2[g, j] += delta * (x - mean[g, j])
+                if x < vmin[g, j]:
+                    vmin[g, j] = x
+                if x > vmax[g, j]:
+                    vmax[g, j] = x
+        return count, mean, m2, vmin, vmax
+    return kernel
+
+def _summary_numba(pitch_types: pd.Series, values: np.ndarray) -> pd.DataFrame:
+    """
+    Build the get_pitch_summary table from categorical pitch types with the numba kernel.
+    
+    Matches the pandas groupby output: observed groups only, ddof=1 standard
+    deviations and NaN statistics for groups without values.
+    """
+    codes = pitch_types.cat.codes.to_numpy().astype(np.int64)
+    n_groups = len(pitch_types.cat.categories)
+    count, mean, m2, vmin, vmax = _summary_kernel()(codes, values, n_groups)
+    
+    observed = np.flatnonzero(np.bincount(codes[codes >= 0], minlength=n_groups))
+    count, mean, m2 = count[observed], mean[observed], m2[observed]
+    vmin, vmax = vmin[observed], vmax[observed]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(count > 0, mean, np.nan)
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+    vmin = np.where(count > 0, vmin, np.nan)
+    vmax = np.where(count > 0, vmax, np.nan)
+    
+    index = pd.CategoricalIndex(
+        pd.Categorical.from_codes(observed, dtype=pitch_types.dtype), name='pitch_type'
+    )
+    return pd.DataFrame({
+        'release_speed_count': count[:, 0].astype(np.int64),
+        'release_speed_mean': mean[:, 0],
+        'release_speed_std': std[:, 0],
+        'release_speed_min': vmin[:, 0],
+        'release_speed_max': vmax[:, 0],
+        'estimated_woba_using_speedangle_mean': mean[:, 1],
+        'estimated_woba_using_speedangle_std': std[:, 1],
+        'delta_run_exp_mean': mean[:, 2],
+        'delta_run_exp_std': std[:, 2],
+    }, index=index).round(3)
+
+def _lower_names(names: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Lowercase a name column, decoding it first if it is dictionary-encoded."""
+    if pa.types.is_dictionary(names.type):
+        names = names.cast(names.type.value_type)
+    return pc.utf8_lower(names)
+
+@functools.lru_cache(maxsize=16)
+def _load_pitcher_index(path: str, mtime_ns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Load a persisted pitcher index (row order, pitcher ids, offsets) once per (path, mtime_ns)."""
+    with np.load(path) as index:
+        return index['order'], index['pitchers'], index['offsets']
+
+def _build_pitcher_index(pitcher: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group row numbers by pitcher.
+    
+    Rows for pitchers[i] are order[offsets[i]:offsets[i + 1]], in file order.
+    """
+    order = np.argsort(pitcher, kind='stable')
+    pitchers, starts = np.unique(pitcher[order], return_index=True)
+    offsets = np.append(starts, len(order))
+    return order, pitchers, offsets
+
+@dataclass(frozen=True)
+class VelocityArrays:
+    """Velocity and wOBA samples sorted by velocity, as contiguous float32 arrays."""
+    velocity: np.ndarray
+    woba: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.velocity)
+
+@dataclass(frozen=True)
+class VelocityBuckets:
+    """Velocity bucket centers with the mean wOBA and pitch count of each non-empty bucket."""
+    velocity: np.ndarray
+    woba: np.ndarray
+    count: np.ndarray
+    
+    def __len__(self) -> int:
+        return int(self.count.sum())
+
+def _velocity_buckets(velocity: np.ndarray, woba: np.ndarray,
+                      width: float = BUCKET_WIDTH_MPH) -> VelocityBuckets:
+    """Collapse velocity/wOBA samples into fixed-width velocity buckets."""
+    if len(velocity) == 0:
+        empty = np.empty(0)
+        return VelocityBuckets(empty, empty, np.empty(0, dtype=np.int64))
+    
+    # Center the buckets on multiples of width so recorded speeds (e.g. 95.3) sit mid-bucket
+    low = round(float(velocity.min()) / width) * width - width / 2
+    n_buckets = int(np.ceil((float(velocity.max()) - low) / width)) + 1
+    edges = low + width * np.arange(n_buckets + 1)
+    counts, _ = np.histogram(velocity, bins=edges)
+    sums, _ = np.histogram(velocity, bins=edges, weights=woba.astype(np.float64))
+    
+    nonempty = counts > 0
+    centers = (edges[:-1] + edges[1:]) / 2
+    return VelocityBuckets(centers[nonempty], sums[nonempty] / counts[nonempty], counts[nonempty])
 
 class DataPipeline:
     """
@@ -10,6 +232,9 @@ class DataPipeline:
     Replaces the need for pybaseball calls in analysis notebooks.
     """
     
+    # Absolute data directories already validated in this process
+    _validated_dirs = set()
+    
     def __init__(self, data_dir: str = None):
         """
         Initialize the data pipeline.
@@ -28,17 +253,26 @@ class DataPipeline:
             self.data_dir = data_dir
             
         self.savant_dir = os.path.join(self.data_dir, 'savant', 'season_data')
+        self.pitcher_agg_dir = os.path.join(self.data_dir, 'pitcher_agg')
         self.player_meta_path = os.path.join(self.data_dir, 'player_meta.feather')
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
         # Validate data directory structure
         self._validate_data_structure()
+        
+        # Load player metadata and the lowercase name -> MLBAM ID lookups once per pipeline
+        mtime_ns = os.stat(self.player_meta_path).st_mtime_ns
+        self._player_meta_table = _load_table(self.player_meta_path, mtime_ns)
+        self._player_meta = _load_frame(self.player_meta_path, mtime_ns)
+        self._build_name_index()
     
     def _validate_data_structure(self):
-        """Validate that the required data files exist."""
+        """Validate that the required data files exist (once per data directory per process)."""
+        data_dir = os.path.abspath(self.data_dir)
+        if data_dir in DataPipeline._validated_dirs:
+            return
+        
         if not os.path.exists(self.savant_dir):
             raise FileNotFoundError(f"Savant data directory not found: {self.savant_dir}")
         
@@ -50,23 +284,101 @@ class DataPipeline:
         if not available_years:
             raise FileNotFoundError("No season data files found")
         
-        self.logger.info(f"Data pipeline initialized with {len(available_years)} years of data")
+        self.logger.info("Data pipeline initialized with %d years of data", len(available_years))
+        DataPipeline._validated_dirs.add(data_dir)
+    
+    @functools.cached_property
+    def available_years(self) -> List[int]:
+        """Sorted years with a season file, scanned once per pipeline."""
+        matches = (_SEASON_FILE.fullmatch(file) for file in os.listdir(self.savant_dir))
+        return sorted({int(m.group(1)) for m in matches if m})
     
     def get_available_years(self) -> List[int]:
         """Get list of available years in the data."""
-        years = []
-        for file in os.listdir(self.savant_dir):
-            if file.endswith('.feather'):
-                try:
-                    year = int(file.replace('.feather', ''))
-                    years.append(year)
-                except ValueError:
-                    continue
-        return sorted(years)
+        return list(self.available_years)
+    
+    def _season_path(self, year: int) -> Optional[str]:
+        """
+        Path of a season's data file, or None if there is none.
+        
+        A pitcher-sorted {year}.parquet (see utils/migrate_feather.py --parquet)
+        takes precedence over {year}.feather unless the feather file was rewritten
+        after it, the same rule player_lookup applies.
+        """
+        parquet_path = os.path.join(self.savant_dir, f'{year}.parquet')
+        feather_path = os.path.join(self.savant_dir, f'{year}.feather')
+        if os.path.exists(parquet_path) and (
+            not os.path.exists(feather_path) or os.path.getmtime(feather_path) <= os.path.getmtime(parquet_path)
+        ):
+            return parquet_path
+        if os.path.exists(feather_path):
+            return feather_path
+        return None
+    
+    def _ensure_pitcher_index(self, year: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Load the pitcher index for a season, building it on first use.
+        
+        The index is saved next to the season file as {year}.pitcher_idx.npz and
+        rebuilt, from the season's pitcher column only, whenever the season file
+        is newer than it.
+        
+        Args:
+            year (int): Season year
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Row order, pitcher ids and offsets
+        """
+        file_path = os.path.join(self.savant_dir, f'{year}.feather')
+        index_path = os.path.join(self.savant_dir, f'{year}.pitcher_idx.npz')
+        
+        try:
+            index_mtime_ns = os.stat(index_path).st_mtime_ns
+            if index_mtime_ns >= os.stat(file_path).st_mtime_ns:
+                return _load_pitcher_index(index_path, index_mtime_ns)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            # An unreadable index (e.g. truncated) is treated as stale and rebuilt
+            self.logger.warning("Rebuilding unreadable pitcher index for %d: %s", year, e)
+        
+        pitcher = _read_columns(file_path, ['pitcher'])['pitcher'].to_numpy()
+        order, pitchers, offsets = _build_pitcher_index(pitcher)
+        tmp_path = None
+        try:
+            # A unique temporary name, so concurrent builders (threads or
+            # processes) never write to the same file before the rename
+            fd, tmp_path = tempfile.mkstemp(dir=self.savant_dir, prefix=f'{year}.pitcher_idx.', suffix='.part')
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, order=order, pitchers=pitchers, offsets=offsets)
+            os.replace(tmp_path, index_path)
+            self.logger.info("Built pitcher index for %d (%d pitchers)", year, len(pitchers))
+        except OSError as e:
+            self.logger.warning("Could not save pitcher index for %d: %s", year, e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return order, pitchers, offsets
     
     def get_player_metadata(self) -> pd.DataFrame:
-        """Load player metadata."""
-        return pd.read_feather(self.player_meta_path)
+        """
+        Load player metadata.
+        
+        The frame is loaded once per pipeline and shared between calls, so callers
+        should not modify it in place.
+        """
+        return self._player_meta
+    
+    def _build_name_index(self):
+        """Build the lowercase full name and (first, last) lookups from player metadata."""
+        player_meta = self._player_meta_table
+        ids = player_meta['key_mlbam'].to_pylist()
+        full = _lower_names(player_meta['name_full']).to_pylist()
+        first = _lower_names(player_meta['name_first']).to_pylist()
+        last = _lower_names(player_meta['name_last']).to_pylist()
+        
+        # Insert in reverse so the first row wins for duplicate names
+        self._name_to_id = dict(zip(reversed(full), reversed(ids)))
+        self._first_last_index = dict(zip(zip(reversed(first), reversed(last)), reversed(ids)))
     
     def find_player_by_name(self, first_name: str, last_name: str) -> Optional[int]:
         """
@@ -79,32 +391,32 @@ class DataPipeline:
         Returns:
             Optional[int]: MLBAM ID if found, None otherwise
         """
-        player_meta = self.get_player_metadata()
-        
         # Create full name for matching
         full_name = f"{first_name} {last_name}".lower()
         
-        # Try exact match first
-        match = player_meta[
-            player_meta['name_full'].str.lower() == full_name
-        ]
-        
-        if len(match) > 0:
-            return match.iloc[0]['key_mlbam']
+        # Try exact matches first
+        player_id = self._name_to_id.get(full_name)
+        if player_id is None:
+            player_id = self._first_last_index.get((first_name.lower(), last_name.lower()))
+        if player_id is not None:
+            return player_id
         
         # Try partial matches
-        match = player_meta[
-            (player_meta['name_first'].str.lower().str.contains(first_name.lower())) &
-            (player_meta['name_last'].str.lower().str.contains(last_name.lower()))
-        ]
+        player_meta = self._player_meta_table
+        match = player_meta['key_mlbam'].filter(pc.and_(
+            pc.match_substring(_lower_names(player_meta['name_first']), first_name.lower()),
+            pc.match_substring(_lower_names(player_meta['name_last']), last_name.lower())
+        ))
         
         if len(match) > 0:
-            self.logger.info(f"Found {len(match)} potential matches for {first_name} {last_name}")
-            return match.iloc[0]['key_mlbam']
+            self.logger.info("Found %d potential matches for %s %s", len(match), first_name, last_name)
+            return match[0].as_py()
         
         return None
     
-    def get_player_data(self, player_id: int, start_year: int, end_year: int) -> pd.DataFrame:
+    def get_player_data(self, player_id: int, start_year: int, end_year: int,
+                        columns: Optional[List[str]] = None,
+                        pitch_type: Optional[str] = None) -> pd.DataFrame:
         """
         Get player data for specified years.
         
@@ -112,38 +424,188 @@ class DataPipeline:
             player_id (int): MLBAM ID of the player
             start_year (int): Starting year
             end_year (int): Ending year
+            columns (Optional[List[str]]): Columns to return, e.g. VELOCITY_ANALYSIS_COLS
+                (default: all columns). Columns missing from a year's file are skipped.
+            pitch_type (Optional[str]): Only return pitches of this type, filtered in
+                Arrow before conversion to pandas (default: all pitch types)
             
         Returns:
             pd.DataFrame: Player data for the specified years
         """
-        data_frames = []
+        predicate = (
+            (ds.field('pitcher') == player_id) &
+            (ds.field('game_year') >= start_year) &
+            (ds.field('game_year') <= end_year)
+        )
+        if pitch_type is not None:
+            predicate &= ds.field('pitch_type') == pitch_type
         
-        for year in range(start_year, end_year + 1):
-            file_path = os.path.join(self.savant_dir, f'{year}.feather')
-            
-            if os.path.exists(file_path):
-                try:
-                    data = pd.read_feather(file_path)
-                    # Filter for pitcher data
-                    player_data = data[data['pitcher'] == player_id]
-                    if len(player_data) > 0:
-                        data_frames.append(player_data)
-                        self.logger.info(f"Found {len(player_data)} pitches for {player_id} in {year}")
-                except Exception as e:
-                    self.logger.error(f"Error reading {file_path}: {e}")
-            else:
-                self.logger.warning(f"No data file for year {year}")
+        years = range(start_year, end_year + 1)
+        # Arrow decoding releases the GIL, so seasons are read and filtered concurrently
+        with ThreadPoolExecutor(max_workers=min(len(years), MAX_LOAD_WORKERS) or 1) as executor:
+            results = executor.map(
+                lambda year: self._load_year_for_pitcher(year, player_id, predicate, columns),
+                years
+            )
+            tables = [table for table in results if table is not None]
         
-        if data_frames:
-            combined_data = pd.concat(data_frames, ignore_index=True)
-            self.logger.info(f"Total pitches found: {len(combined_data)}")
+        if tables:
+            # Concatenate in Arrow (promoting columns added in later seasons) and convert once.
+            # The filtered tables are private to this call, so their buffers can be
+            # released column by column while pandas takes ownership.
+            combined = concat_season_tables(tables)
+            del tables
+            combined_data = self._compact(
+                combined.to_pandas(self_destruct=True, split_blocks=True)
+            )
+            del combined
+            self.logger.info("Total pitches found: %d", len(combined_data))
             return combined_data
         else:
-            self.logger.warning(f"No data found for player {player_id}")
+            self.logger.warning("No data found for player %s", player_id)
             return pd.DataFrame()
     
+    def get_pitcher_agg_data(self, player_id: int, start_year: int, end_year: int,
+                             columns: Optional[List[str]] = None,
+                             pitch_type: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Get player data from the per-pitcher aggregate, if it can answer the query.
+        
+        The aggregate (see utils/build_pitcher_agg.py) holds only PITCHER_AGG_COLS
+        for all seasons in one small directory per pitcher, so reading it skips the
+        season files entirely.
+        
+        Args:
+            player_id (int): MLBAM ID of the player
+            start_year (int): Starting year
+            end_year (int): Ending year
+            columns (Optional[List[str]]): Columns to return; must be covered by
+                PITCHER_AGG_COLS (plus 'pitcher')
+            pitch_type (Optional[str]): Only return pitches of this type (default: all)
+            
+        Returns:
+            Optional[pd.DataFrame]: Player data, or None if the aggregate is missing,
+            older than a season file in the range, or lacks a requested column
+        """
+        if columns is None or not set(columns) <= {'pitcher', *PITCHER_AGG_COLS}:
+            return None
+        
+        partition_dir = os.path.join(self.pitcher_agg_dir, f'pitcher={player_id}')
+        if not os.path.isdir(partition_dir):
+            return None
+        
+        # Equal timestamps count as stale, since mtimes can share a clock tick
+        agg_mtime_ns = os.stat(self.pitcher_agg_dir).st_mtime_ns
+        for year in range(start_year, end_year + 1):
+            file_path = self._season_path(year)
+            if file_path is not None and os.stat(file_path).st_mtime_ns >= agg_mtime_ns:
+                return None
+        
+        predicate = (ds.field('game_year') >= start_year) & (ds.field('game_year') <= end_year)
+        if pitch_type is not None:
+            predicate &= ds.field('pitch_type') == pitch_type
+        
+        try:
+            read_columns = [c for c in columns if c != 'pitcher']
+            table = ds.dataset(partition_dir, format='parquet').to_table(
+                filter=predicate, columns=read_columns
+            )
+        except Exception as e:
+            self.logger.error("Error reading %s: %s", partition_dir, e)
+            return None
+        
+        if 'pitcher' in columns:
+            table = table.append_column(
+                'pitcher', pa.array(np.full(table.num_rows, player_id, dtype=np.int64))
+            ).select(list(columns))
+        
+        self.logger.info("Found %d pitches for %s in the pitcher aggregate", table.num_rows, player_id)
+        return self._compact(table.to_pandas(self_destruct=True, split_blocks=True))
+    
+    def _load_year_for_pitcher(self, year: int, player_id: int, predicate: ds.Expression,
+                               columns: Optional[List[str]]) -> Optional[pa.Table]:
+        """
+        Read one season and return the pitcher's rows, or None if there are none.
+        
+        Args:
+            year (int): Season year
+            player_id (int): MLBAM ID of the player
+            predicate (ds.Expression): Pitcher and year range row filter
+            columns (Optional[List[str]]): Columns to return (default: all columns)
+        """
+        file_path = self._season_path(year)
+        
+        if file_path is None:
+            self.logger.warning("No data file for year %d", year)
+            return None
+        
+        try:
+            if file_path.endswith('.parquet'):
+                # Parquet files are sorted by pitcher, so row group statistics
+                # let the scan skip every row group without this pitcher
+                dataset = ds.dataset(file_path, format='parquet')
+                if columns is not None:
+                    year_columns = [c for c in columns if c in dataset.schema.names]
+                else:
+                    year_columns = None
+                player_data = dataset.to_table(filter=predicate, columns=year_columns)
+            else:
+                player_data = self._filter_feather(year, file_path, player_id, predicate, columns)
+        except Exception as e:
+            self.logger.error("Error reading %s: %s", file_path, e)
+            return None
+        
+        if player_data.num_rows == 0:
+            return None
+        self.logger.info("Found %d pitches for %s in %d", player_data.num_rows, player_id, year)
+        return player_data
+    
+    def _filter_feather(self, year: int, file_path: str, player_id: int, predicate: ds.Expression,
+                        columns: Optional[List[str]]) -> pa.Table:
+        """
+        Return a pitcher's rows from a feather season via the pitcher index.
+        
+        Only the requested columns and the predicate's columns are read, and
+        only the (small) pitcher index is cached between calls.
+        """
+        read_columns = None if columns is None else list(columns) + _PREDICATE_COLS
+        # Use the pitcher index to take only this pitcher's rows,
+        # then apply the year filter and column projection in Arrow
+        order, pitchers, offsets = self._ensure_pitcher_index(year)
+        i = np.searchsorted(pitchers, player_id)
+        if i < len(pitchers) and pitchers[i] == player_id:
+            rows = order[offsets[i]:offsets[i + 1]]
+        else:
+            rows = order[:0]
+        data = _read_columns(file_path, read_columns)
+        if columns is not None:
+            year_columns = [c for c in columns if c in data.schema.names]
+        else:
+            year_columns = None
+        return ds.dataset(data.take(rows)).to_table(
+            filter=predicate, columns=year_columns
+        )
+    
+    @staticmethod
+    def _compact(player_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast the analysis columns to float32 and pitch types to category.
+        
+        Pitch types decoded from Arrow dictionaries keep the dictionary's
+        first-seen order, so the categories are sorted to give get_pitch_summary
+        (and anything else grouping by them) the same order as plain strings.
+        """
+        dtypes = {col: dtype for col, dtype in _COMPACT_DTYPES.items() if col in player_data.columns}
+        player_data = player_data.astype(dtypes)
+        if 'pitch_type' in player_data.columns:
+            pitch_types = player_data['pitch_type'].cat
+            player_data['pitch_type'] = pitch_types.reorder_categories(sorted(pitch_types.categories))
+        return player_data
+    
     def get_pitcher_data_by_name(self, first_name: str, last_name: str, 
-                                start_year: int, end_year: int) -> pd.DataFrame:
+                                start_year: int, end_year: int,
+                                columns: Optional[List[str]] = None,
+                                pitch_type: Optional[str] = None) -> pd.DataFrame:
         """
         Get pitcher data by name.
         
@@ -152,6 +614,9 @@ class DataPipeline:
             last_name (str): Player's last name
             start_year (int): Starting year
             end_year (int): Ending year
+            columns (Optional[List[str]]): Columns to return, e.g. VELOCITY_ANALYSIS_COLS
+                (default: all columns)
+            pitch_type (Optional[str]): Only return pitches of this type (default: all)
             
         Returns:
             pd.DataFrame: Pitcher data
@@ -159,11 +624,11 @@ class DataPipeline:
         player_id = self.find_player_by_name(first_name, last_name)
         
         if player_id is None:
-            self.logger.error(f"Player not found: {first_name} {last_name}")
+            self.logger.error("Player not found: %s %s", first_name, last_name)
             return pd.DataFrame()
         
-        self.logger.info(f"Found player {first_name} {last_name} with ID: {player_id}")
-        return self.get_player_data(player_id, start_year, end_year)
+        self.logger.info("Found player %s %s with ID: %s", first_name, last_name, player_id)
+        return self.get_player_data(player_id, start_year, end_year, columns, pitch_type)
     
     def get_pitch_type_data(self, player_data: pd.DataFrame, pitch_type: str) -> pd.DataFrame:
         """
@@ -176,8 +641,18 @@ class DataPipeline:
         Returns:
             pd.DataFrame: Filtered data for the specified pitch type
         """
-        filtered_data = player_data[player_data['pitch_type'] == pitch_type].copy()
-        self.logger.info(f"Found {len(filtered_data)} {pitch_type} pitches")
+        pitch_types = player_data['pitch_type']
+        if isinstance(pitch_types.dtype, pd.CategoricalDtype):
+            # Compare integer codes rather than the decoded strings
+            code = pitch_types.cat.categories.get_indexer([pitch_type])[0]
+            if code >= 0:
+                mask = pitch_types.cat.codes.to_numpy() == code
+            else:
+                mask = np.zeros(len(pitch_types), dtype=bool)
+        else:
+            mask = pitch_types.to_numpy() == pitch_type
+        filtered_data = player_data.take(np.flatnonzero(mask))
+        self.logger.info("Found %d %s pitches", len(filtered_data), pitch_type)
         return filtered_data
     
     def get_pitch_summary(self, player_data: pd.DataFrame) -> pd.DataFrame:
@@ -190,42 +665,79 @@ class DataPipeline:
         Returns:
             pd.DataFrame: Summary statistics by pitch type
         """
-        summary = player_data.groupby('pitch_type').agg({
+        if isinstance(player_data['pitch_type'].dtype, pd.CategoricalDtype) and _summary_kernel() is not None:
+            values = player_data[_SUMMARY_COLS].to_numpy(dtype=np.float64)
+            return _summary_numba(player_data['pitch_type'], values)
+        
+        summary = player_data.groupby('pitch_type', observed=True).agg({
             'release_speed': ['count', 'mean', 'std', 'min', 'max'],
             'estimated_woba_using_speedangle': ['mean', 'std'],
             'delta_run_exp': ['mean', 'std']
-        }).round(3)
+        })
+        
+        # Round in float64 so float32 inputs don't show representation noise
+        summary = summary.astype(
+            {col: 'float64' for col, dtype in summary.dtypes.items() if dtype == np.float32}
+        ).round(3)
         
         # Flatten column names
         summary.columns = ['_'.join(col).strip() for col in summary.columns]
         return summary
     
     def prepare_velocity_analysis_data(self, player_data: pd.DataFrame, 
-                                     pitch_type: str = 'FF') -> pd.DataFrame:
+                                     pitch_type: str = 'FF',
+                                     as_arrays: bool = False,
+                                     bucketize: bool = False) -> Union[pd.DataFrame, VelocityArrays, VelocityBuckets]:
         """
         Prepare data specifically for velocity cliff analysis.
         
         Args:
             player_data (pd.DataFrame): Player data
             pitch_type (str): Pitch type to analyze (default: 'FF' for fastball)
+            as_arrays (bool): Return only the sorted velocity and wOBA columns as
+                VelocityArrays instead of a DataFrame (default: False)
+            bucketize (bool): Return VelocityBuckets of BUCKET_WIDTH_MPH-wide velocity
+                buckets with mean wOBA and pitch counts (default: False)
             
         Returns:
-            pd.DataFrame: Prepared data for velocity analysis
+            Union[pd.DataFrame, VelocityArrays, VelocityBuckets]: Prepared data for velocity analysis
         """
         # Filter for specific pitch type
         pitch_data = self.get_pitch_type_data(player_data, pitch_type)
         
         if len(pitch_data) == 0:
-            self.logger.warning(f"No {pitch_type} data found")
+            self.logger.warning("No %s data found", pitch_type)
+            if bucketize:
+                return _velocity_buckets(np.empty(0), np.empty(0))
+            if as_arrays:
+                empty = np.empty(0, dtype=np.float32)
+                return VelocityArrays(empty, empty)
             return pd.DataFrame()
         
         # Remove rows with missing velocity or wOBA data
         clean_data = pitch_data.dropna(subset=['release_speed', 'estimated_woba_using_speedangle'])
         
-        # Sort by velocity for analysis
-        clean_data = clean_data.sort_values('release_speed').reset_index(drop=True)
+        # Sort by velocity for analysis: argsort the contiguous float32 speeds,
+        # then permute the rows once
+        speeds = clean_data['release_speed'].to_numpy(dtype=np.float32)
+        
+        if bucketize:
+            woba = clean_data['estimated_woba_using_speedangle'].to_numpy(dtype=np.float32)
+            buckets = _velocity_buckets(speeds, woba)
+            self.logger.info("Prepared %d %s pitches in %d velocity buckets",
+                             len(speeds), pitch_type, len(buckets.velocity))
+            return buckets
         
-        self.logger.info(f"Prepared {len(clean_data)} {pitch_type} pitches for velocity analysis")
+        order = np.argsort(speeds, kind='stable')
+        
+        if as_arrays:
+            woba = clean_data['estimated_woba_using_speedangle'].to_numpy(dtype=np.float32)
+            self.logger.info("Prepared %d %s pitches for velocity analysis", len(order), pitch_type)
+            return VelocityArrays(np.ascontiguousarray(speeds[order]), np.ascontiguousarray(woba[order]))
+        
+        clean_data = clean_data.take(order).reset_index(drop=True)
+        
+        self.logger.info("Prepared %d %s pitches for velocity analysis", len(clean_data), pitch_type)
         return clean_data
     
     def get_team_colors(self) -> Dict[str, str]:
@@ -247,11 +759,16 @@ class DataPipeline:
         total_pitches = 0
         for year in years:
             try:
-                file_path = os.path.join(self.savant_dir, f'{year}.feather')
-                data = pd.read_feather(file_path)
-                total_pitches += len(data)
+                file_path = self._season_path(year)
+                file_format = 'parquet' if file_path.endswith('.parquet') else 'feather'
+                try:
+                    # Row counts come from the file footer, no column data is decoded
+                    total_pitches += ds.dataset(file_path, format=file_format).count_rows()
+                except pa.ArrowInvalid:
+                    # Feather V1 files are not Arrow IPC files
+                    total_pitches += _read_columns(file_path, ['pitcher']).num_rows
             except Exception as e:
-                self.logger.error(f"Error reading {year} data: {e}")
+                self.logger.error("Error reading %d data: %s", year, e)
         
         return {
             'available_years': years,
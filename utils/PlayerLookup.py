@@ -1,7 +1,279 @@
 import os
+import tempfile
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import feather
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ArrowTables import concat_season_tables
 
-def player_lookup(player_id, start_year, end_year, data_dir='../data/savant/season_data/'):
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Upper bound on seasons read concurrently by player_lookup
+MAX_READ_WORKERS = 8
+
+# Set ANALYTICO_USE_POLARS=1 to filter season feather files with a Polars lazy scan
+USE_POLARS = pl is not None and os.environ.get('ANALYTICO_USE_POLARS') == '1'
+
+# Layout of the pitcher-partitioned season dataset written by migrate_feather.py --by-pitcher:
+# by_pitcher/year=YYYY/pitcher=ID/*.parquet, next to the season_data directory
+BY_PITCHER_PARTITIONING = ds.partitioning(
+    pa.schema([('year', pa.int16()), ('pitcher', pa.int64())]), flavor='hive'
+)
+
+def by_pitcher_dir(data_dir):
+    """Directory of the pitcher-partitioned dataset that sits next to `data_dir`."""
+    return os.path.join(os.path.dirname(os.path.normpath(data_dir)), 'by_pitcher')
+
+def read_pitcher_partition(partition_dir, player_id, columns=None, pitch_type=None):
+    """
+    Read one year=YYYY/pitcher=ID partition of the pitcher-partitioned dataset.
+
+    Args:
+        partition_dir (str): Path to the partition directory.
+        player_id (int): MLBAM ID of the player (restored as the pitcher column).
+        columns (list): Columns to return (default: all columns).
+        pitch_type (str): Only return pitches of this type (default: all pitch types).
+
+    Returns:
+        pa.Table: The player's rows for that year.
+    """
+    read_columns = None if columns is None else [c for c in columns if c != 'pitcher']
+    predicate = None if pitch_type is None else ds.field('pitch_type') == pitch_type
+    table = ds.dataset(partition_dir, format='parquet').to_table(columns=read_columns, filter=predicate)
+    table = table.append_column('pitcher', pa.array(np.full(table.num_rows, player_id, dtype=np.int64)))
+    if columns is not None:
+        table = table.select(list(columns))
+    return table
+
+def lookup_cache_path(data_dir, player_id, start_year, end_year):
+    """Path of the cached player_lookup result for a player and year range."""
+    return os.path.join(data_dir, '.cache', f'{player_id}_{start_year}_{end_year}.parquet')
+
+def cache_is_fresh(cache_path, data_dir, start_year, end_year):
+    """
+    Check that a cached lookup is newer than every season source it was built from.
+
+    Args:
+        cache_path (str): Path of the cached parquet file.
+        data_dir (str): Path to the directory containing season data feather files.
+        start_year (int): Starting year of the range.
+        end_year (int): Ending year of the range.
+
+    Returns:
+        bool: True if the cache exists and no season file or partition is newer.
+    """
+    if not os.path.exists(cache_path):
+        return False
+    cache_mtime = os.path.getmtime(cache_path)
+    partitioned_dir = by_pitcher_dir(data_dir)
+    for year in range(start_year, end_year + 1):
+        for source in (os.path.join(data_dir, f'{year}.feather'),
+                       os.path.join(data_dir, f'{year}.parquet'),
+                       os.path.join(partitioned_dir, f'year={year}')):
+            # Equal timestamps count as stale, since mtimes can share a clock tick
+            if os.path.exists(source) and os.path.getmtime(source) >= cache_mtime:
+                return False
+    return True
+
+def pitcher_rows(pitcher, player_id):
+    """
+    Positions of the rows whose pitcher equals player_id.
+
+    Uses numexpr's blocked, vectorized evaluator for the comparison when it is
+    installed, otherwise a plain numpy comparison.
+
+    Args:
+        pitcher (np.ndarray): The season's pitcher column.
+        player_id (int): MLBAM ID of the player.
+
+    Returns:
+        np.ndarray: Row positions, in file order.
+    """
+    if ne is not None:
+        mask = ne.evaluate('p == pid', local_dict={'p': pitcher, 'pid': np.int64(player_id)})
+    else:
+        mask = pitcher == player_id
+    return np.flatnonzero(mask)
+
+def read_sorted_parquet(parquet_path, player_id, columns=None, pitch_type=None):
+    """
+    Read a player's rows from a pitcher-sorted season parquet file.
+
+    The file is written by migrate_feather.py --parquet sorted by pitcher in small
+    row groups, so the pitcher filter skips every row group whose min/max
+    statistics exclude the player.
+
+    Args:
+        parquet_path (str): Path to the {year}.parquet season file.
+        player_id (int): MLBAM ID of the player.
+        columns (list): Columns to return (default: all columns).
+        pitch_type (str): Only return pitches of this type (default: all pitch types).
+
+    Returns:
+        pa.Table: The player's rows.
+    """
+    filters = [('pitcher', '=', player_id)]
+    if pitch_type is not None:
+        filters.append(('pitch_type', '=', pitch_type))
+    return pq.read_table(parquet_path, columns=columns, filters=filters)
+
+def scan_season_polars(file_path, player_id, columns=None, pitch_type=None):
+    """
+    Read a player's rows from a season feather file with a Polars lazy scan.
+
+    The pitcher (and pitch type) filter and column selection are pushed down into
+    the IPC scan, which runs on the streaming engine.
+
+    Args:
+        file_path (str): Path to the season feather file.
+        player_id (int): MLBAM ID of the player.
+        columns (list): Columns to return (default: all columns).
+        pitch_type (str): Only return pitches of this type (default: all pitch types).
+
+    Returns:
+        pa.Table: The player's rows.
+    """
+    condition = pl.col('pitcher') == player_id
+    if pitch_type is not None:
+        condition = condition & (pl.col('pitch_type') == pitch_type)
+    query = pl.scan_ipc(file_path).filter(condition)
+    if columns is not None:
+        query = query.select(list(columns))
+    return query.collect(engine='streaming').to_arrow()
+
+def filter_season_batches(file_path, player_id, columns=None, memory_map=True, pitch_type=None):
+    """
+    Read a player's rows from a season feather file one record batch at a time.
+
+    Only the requested columns (and the filter columns) are decoded, and each
+    batch is cut down to the player's rows before the next one is read, so peak
+    memory is about one batch rather than the whole season. Feather V1 files,
+    which are not Arrow IPC files, are read whole and filtered.
+
+    Args:
+        file_path (str): Path to the season feather file.
+        player_id (int): MLBAM ID of the player.
+        columns (list): Columns to return (default: all columns).
+        memory_map (bool): Memory-map the feather file.
+        pitch_type (str): Only return pitches of this type (default: all pitch types).
+
+    Returns:
+        pa.Table: The player's rows.
+    """
+    # The filter columns are always read and dropped afterwards if not requested
+    read_columns = None
+    if columns is not None:
+        filter_columns = ['pitcher'] if pitch_type is None else ['pitcher', 'pitch_type']
+        read_columns = [c for c in filter_columns if c not in columns] + list(columns)
+
+    source = pa.memory_map(file_path, 'r') if memory_map else pa.OSFile(file_path, 'rb')
+    with source:
+        try:
+            reader = pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            table = feather.read_table(file_path, columns=read_columns, memory_map=memory_map)
+            table = table.take(pitcher_rows(table['pitcher'].to_numpy(), player_id))
+            if pitch_type is not None:
+                table = table.filter(pc.equal(table['pitch_type'], pitch_type))
+            return table if columns is None else table.select(list(columns))
+
+        schema = reader.schema
+        if read_columns is not None:
+            missing = [c for c in read_columns if schema.get_field_index(c) < 0]
+            if missing:
+                raise ValueError(f"Columns not found: {', '.join(missing)}")
+            # Reopen with the projection so unused columns are never decompressed
+            included = sorted(schema.get_field_index(c) for c in read_columns)
+            reader = pa.ipc.open_file(source, options=pa.ipc.IpcReadOptions(included_fields=included))
+            schema = reader.schema
+
+        batches = []
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            rows = pitcher_rows(batch.column('pitcher').to_numpy(), player_id)
+            if len(rows):
+                batch = batch.take(rows)
+                if pitch_type is not None:
+                    batch = batch.filter(pc.equal(batch.column('pitch_type'), pitch_type))
+                batches.append(batch)
+
+    table = pa.Table.from_batches(batches, schema=schema)
+    return table if columns is None else table.select(list(columns))
+
+def read_year(year, player_id, data_dir, columns=None, memory_map=True, pitch_type=None):
+    """
+    Read one season's rows for a player as an Arrow table.
+
+    Args:
+        year (int): Season year.
+        player_id (int): MLBAM ID of the player.
+        data_dir (str): Path to the directory containing season data feather files.
+        columns (list): Columns to return (default: all columns).
+        memory_map (bool): Memory-map the feather file.
+        pitch_type (str): Only return pitches of this type (default: all pitch types).
+
+    Returns:
+        pa.Table: The player's rows, or None if the season could not be read.
+    """
+    file_path = os.path.join(data_dir, f'{year}.feather')
+    year_dir = os.path.join(by_pitcher_dir(data_dir), f'year={year}')
+
+    # Use the partitioned dataset unless the season file was rewritten after it
+    if os.path.isdir(year_dir) and (
+        not os.path.exists(file_path) or os.path.getmtime(file_path) <= os.path.getmtime(year_dir)
+    ):
+        partition_dir = os.path.join(year_dir, f'pitcher={player_id}')
+        if os.path.isdir(partition_dir):
+            try:
+                return read_pitcher_partition(partition_dir, player_id, columns, pitch_type)
+            except Exception as e:
+                print(f"Error reading partition {partition_dir}: {e}")
+        return None
+
+    # Next, a pitcher-sorted parquet copy of the season, under the same rule
+    parquet_path = os.path.join(data_dir, f'{year}.parquet')
+    if os.path.exists(parquet_path) and (
+        not os.path.exists(file_path) or os.path.getmtime(file_path) <= os.path.getmtime(parquet_path)
+    ):
+        try:
+            return read_sorted_parquet(parquet_path, player_id, columns, pitch_type)
+        except Exception as e:
+            print(f"Error reading file {parquet_path}: {e}")
+            return None
+
+    # Check if the feather file exists for the year
+    if not os.path.exists(file_path):
+        print(f"File not found for year {year}: {file_path}")
+        return None
+
+    if USE_POLARS:
+        try:
+            return scan_season_polars(file_path, player_id, columns, pitch_type)
+        except Exception:
+            # Polars can't read every file pyarrow can, e.g. the delta dictionaries
+            # fetch_data.py writes, so read those with pyarrow below
+            pass
+
+    try:
+        return filter_season_batches(file_path, player_id, columns, memory_map, pitch_type)
+    except Exception as e:
+        print(f"Error reading file {file_path}: {e}")
+        return None
+
+def player_lookup(player_id, start_year, end_year, data_dir='../data/savant/season_data/',
+                  columns=None, memory_map=True, pitch_type=None):
     """
     Retrieve data for a specific player from the feather database within a specified year range.
 
@@ -10,42 +282,88 @@ def player_lookup(player_id, start_year, end_year, data_dir='../data/savant/seas
         start_year (int): Starting year of the range.
         end_year (int): Ending year of the range.
         data_dir (str): Path to the directory containing season data feather files.
+            If a pitcher-partitioned dataset (see migrate_feather.py --by-pitcher) sits
+            next to it, years it covers are read from the player's partition instead.
+            Otherwise a pitcher-sorted {year}.parquet (migrate_feather.py --parquet)
+            is read in place of {year}.feather.
+        columns (list): Columns to return, e.g. ['pitcher', 'pitch_type', 'release_speed',
+            'estimated_woba_using_speedangle'] (default: all columns).
+        memory_map (bool): Memory-map the feather files. Good on SSDs; pass False on
+            spinning disks, where sequential reads are faster.
+        pitch_type (str): Only return pitches of this type, e.g. 'FF'. The filter is
+            applied in Arrow while each season is read (default: all pitch types).
+
+    With ANALYTICO_USE_POLARS=1 and polars installed, season feather files are
+    filtered by a Polars lazy scan instead of pyarrow; files Polars cannot read are
+    still read with pyarrow.
+
+    Full-column results are cached as data_dir/.cache/{player_id}_{start_year}_{end_year}.parquet
+    and reused (including for column subsets and pitch types) until a season file or
+    partition changes.
 
     Returns:
         pd.DataFrame: DataFrame containing the filtered data for the player.
     """
-    # Initialize an empty list to store data
-    data_frames = []
+    # Fast path: a cached result that is newer than every season source
+    cache_path = lookup_cache_path(data_dir, player_id, start_year, end_year)
+    if cache_is_fresh(cache_path, data_dir, start_year, end_year):
+        try:
+            filters = None if pitch_type is None else [('pitch_type', '=', pitch_type)]
+            return pd.read_parquet(cache_path, columns=columns, filters=filters)
+        except Exception as e:
+            print(f"Error reading cache {cache_path}: {e}")
 
-    # Loop through the years in the range
-    for year in range(start_year, end_year + 1):
-        file_path = os.path.join(data_dir, f'{year}.feather')
+    # Read the years concurrently; Arrow releases the GIL while reading and filtering
+    years = range(start_year, end_year + 1)
+    tables_by_year = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(years)) or 1) as executor:
+        futures = {
+            executor.submit(read_year, year, player_id, data_dir, columns, memory_map, pitch_type): year
+            for year in years
+        }
+        for future in as_completed(futures):
+            table = future.result()
+            if table is not None:
+                tables_by_year[futures[future]] = table
 
-        # Check if the feather file exists for the year
-        if os.path.exists(file_path):
-            try:
-                # Read the feather file
-                data = pd.read_feather(file_path)
-                # Filter data for the given player_id
-                player_data = data[data['pitcher'] == player_id]
-                data_frames.append(player_data)
-            except Exception as e:
-                print(f"Error reading file {file_path}: {e}")
-        else:
-            print(f"File not found for year {year}: {file_path}")
+    # Keep the tables in year order regardless of completion order
+    tables = [tables_by_year[year] for year in sorted(tables_by_year)]
 
-    # Concatenate all filtered data
-    if data_frames:
-        return pd.concat(data_frames, ignore_index=True)
-    else:
+    # Concatenate all filtered data in Arrow and convert once, releasing
+    # each Arrow buffer as pandas takes it over
+    if not tables:
         # Return an empty DataFrame if no data was found
         return pd.DataFrame()
 
+    combined = concat_season_tables(tables)
+    del tables, tables_by_year
+    player_data = combined.to_pandas(self_destruct=True, split_blocks=True)
+
+    # Cache full-column, all-pitch results; subsets can be served from them
+    if columns is None and pitch_type is None and len(player_data) > 0:
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # A unique temporary name, so concurrent lookups of the same player
+            # and range never write to the same file before the rename
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path),
+                                            prefix=os.path.basename(cache_path) + '.', suffix='.part')
+            with os.fdopen(fd, 'wb') as f:
+                player_data.to_parquet(f, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Error writing cache {cache_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return player_data
+
 if __name__ == "__main__":
     # Example usage
     example_player_id = 656427
     example_start_year = 2024
     example_end_year = 2024
 
-    player_data = player_lookup(example_player_id, example_start_year, example_end_year)
+    player_data = player_lookup(example_player_id, example_start_year, example_end_year,
+                                columns=['pitch_type', 'release_speed', 'estimated_woba_using_speedangle'])
     print(player_data.head())
@@ -0,0 +1,47 @@
+import re
+from importlib.metadata import version, PackageNotFoundError
+from typing import List
+
+def missing_requirements(path: str = 'requirements.txt') -> List[str]:
+    """
+    Find the requirements that are not satisfied by the installed packages.
+
+    Installed versions are read from package metadata, so nothing is imported
+    and pip's resolver is not run. If `packaging` is unavailable only the
+    presence of each package is checked.
+
+    Args:
+        path (str): Path to a pip requirements file.
+
+    Returns:
+        List[str]: Requirement specifiers (as written in the file) that need installing.
+    """
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+
+    missing = []
+    with open(path) as f:
+        for line in f:
+            spec = line.split('#', 1)[0].strip()
+            if not spec:
+                continue
+
+            if Requirement is not None:
+                requirement = Requirement(spec)
+                name = requirement.name
+            else:
+                requirement = None
+                name = re.match(r'[A-Za-z0-9._-]+', spec).group(0)
+
+            try:
+                installed = version(name)
+            except PackageNotFoundError:
+                missing.append(spec)
+                continue
+
+            if requirement is not None and not requirement.specifier.contains(installed, prereleases=True):
+                missing.append(spec)
+
+    return missing
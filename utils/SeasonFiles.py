@@ -0,0 +1,21 @@
+import os
+from typing import List, Tuple
+
+def list_season_files(season_dir) -> List[Tuple[str, int]]:
+    """
+    List season feather files and their sizes with a single directory scan.
+
+    Args:
+        season_dir: Path to the directory containing season data feather files.
+
+    Returns:
+        List[Tuple[str, int]]: (file name, size in bytes) pairs sorted by file name.
+    """
+    with os.scandir(season_dir) as entries:
+        files = [
+            (entry.name, entry.stat().st_size)
+            for entry in entries
+            if entry.name.endswith('.feather')
+        ]
+    files.sort()
+    return files
@@ -1,26 +1,177 @@
-import matplotlib.pyplot as plt
+import functools
 import numpy as np
 import pandas as pd
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List, Union
 import logging
+from DataPipeline import VelocityArrays, VelocityBuckets, VELOCITY_ANALYSIS_COLS
+
+# Number of velocity bins used for the default (binned) velocity vs wOBA plots
+PLOT_BINS = 200
+
+def binned_means(x, y, n_bins: int = PLOT_BINS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean of y in equal-width bins of x, for plotting large samples.
+    
+    Args:
+        x: Values to bin (e.g. release speed)
+        y: Values to average within each bin (e.g. estimated wOBA)
+        n_bins (int): Number of bins across the range of x
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Centers and y means of the non-empty bins
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    if len(x) == 0:
+        return x, y
+    
+    edges = np.linspace(x.min(), x.max(), n_bins + 1)
+    idx = np.clip(np.digitize(x, edges) - 1, 0, n_bins - 1)
+    counts = np.bincount(idx, minlength=n_bins)
+    sums = np.bincount(idx, weights=y, minlength=n_bins)
+    
+    nonempty = counts > 0
+    centers = (edges[:-1] + edges[1:]) / 2
+    return centers[nonempty], sums[nonempty] / counts[nonempty]
+
+def centered_rolling_mean(y, window: int) -> np.ndarray:
+    """
+    Centered rolling mean of y, matching pandas rolling(window, center=True, min_periods=1).mean().
+    
+    Each window sum is a difference of two prefix sums, so the whole series is
+    smoothed in O(n) without building a pandas Series. Windows are clipped at the
+    edges and NaNs are skipped, as pandas does.
+    
+    Args:
+        y: Values to smooth (e.g. wOBA sorted by velocity)
+        window (int): Window size
+    
+    Returns:
+        np.ndarray: Smoothed values (NaN where a window has no valid values)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    valid = ~np.isnan(y)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, y, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    
+    offsets = np.arange(n) - window // 2
+    start = np.clip(offsets, 0, n)
+    end = np.clip(offsets + window, 0, n)
+    window_counts = counts[end] - counts[start]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(window_counts > 0, (sums[end] - sums[start]) / window_counts, np.nan)
+
+def _bayesian_changepoint(cw, cs, cs2, sigma, proposals, log_uniforms):
+    """
+    Metropolis search for the changepoint of a two-segment Gaussian model.
+    
+    cw, cs and cs2 are prefix sums (with a leading zero) of the weights, the
+    weighted values and the weighted squared values, so each segment mean and
+    sum of squared errors is O(1) per proposal. Both segments share sigma, so a
+    changepoint's log-likelihood is a constant minus (SSE1 + SSE2) / (2 sigma^2);
+    the constant cancels in the acceptance ratio. The proposed changepoints and the
+    logs of the acceptance draws are passed in, one per iteration, so the loop makes
+    no RNG calls and tests acceptance in log space, without exp overflow or underflow.
+    
+    Returns the highest-likelihood changepoint proposed, tracked as the chain runs
+    (the posterior mode under a flat prior) rather than counted from stored samples.
+    """
+    n = len(cw) - 1
+    inv_2s2 = 0.5 / (sigma * sigma)
+    
+    def log_likelihood(cp):
+        sse1 = cs2[cp] - cs[cp] * cs[cp] / cw[cp]
+        s, s2, w = cs[n] - cs[cp], cs2[n] - cs2[cp], cw[n] - cw[cp]
+        sse2 = s2 - s * s / w
+        return -(sse1 + sse2) * inv_2s2
+    
+    cp = n // 2
+    log_lik = log_likelihood(cp)
+    best_cp, best_log_lik = cp, log_lik
+    for t in range(len(proposals)):
+        # Only the proposed changepoint's likelihood needs computing
+        cp_new = proposals[t]
+        log_lik_new = log_likelihood(cp_new)
+        if log_lik_new > best_log_lik:
+            best_cp, best_log_lik = cp_new, log_lik_new
+        
+        if log_uniforms[t] < log_lik_new - log_lik:
+            cp = cp_new
+            log_lik = log_lik_new
+    
+    return best_cp
+
+@functools.lru_cache(maxsize=None)
+def _compiled_bayesian_changepoint():
+    """_bayesian_changepoint compiled with numba on first use, or as is without numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return _bayesian_changepoint
+    return njit(cache=True)(_bayesian_changepoint)
+
+def _exact_changepoint(cw, cs, cs2, edge):
+    """
+    Maximum a posteriori changepoint of the same two-segment Gaussian model, by direct scan.
+    
+    With sigma known and a flat prior, the posterior of each candidate is
+    proportional to exp(-(SSE1 + SSE2) / (2 sigma^2)), so the changepoint that
+    minimizes the combined SSE is the exact mode. Every candidate is evaluated
+    at once from the prefix sums.
+    """
+    n = len(cw) - 1
+    cps = np.arange(edge, n - edge)
+    sse1 = cs2[cps] - cs[cps] ** 2 / cw[cps]
+    sse2 = (cs2[n] - cs2[cps]) - (cs[n] - cs[cps]) ** 2 / (cw[n] - cw[cps])
+    return cps[np.argmin(sse1 + sse2)]
 
 class VelocityCliffAnalyzer:
     """
     Analyzer for velocity cliff phenomenon in baseball pitching.
     """
     
-    def __init__(self, data_pipeline):
+    def __init__(self, data_pipeline, full_resolution: bool = False):
         """
         Initialize the analyzer.
         
         Args:
             data_pipeline: Data pipeline instance
+            full_resolution (bool): Scatter every pitch in velocity vs wOBA plots
+                instead of plotting binned means (default: False)
         """
         self.data_pipeline = data_pipeline
         self.logger = data_pipeline.logger
+        self.full_resolution = full_resolution
+    
+    @staticmethod
+    def _sorted_velocity_woba(fastball_data: Union[pd.DataFrame, VelocityArrays]) -> Tuple[np.ndarray, np.ndarray]:
+        """Velocity and wOBA arrays sorted by velocity, from a pandas or Polars DataFrame or VelocityArrays."""
+        if isinstance(fastball_data, VelocityArrays):
+            return fastball_data.velocity, fastball_data.woba
+        
+        x_column = 'release_speed'
+        y_column = 'estimated_woba_using_speedangle'
+        # Sort just the two columns instead of reordering the whole DataFrame
+        x_data = fastball_data[x_column].to_numpy()
+        y_data = fastball_data[y_column].to_numpy()
+        order = np.argsort(x_data, kind='stable')
+        return x_data[order], y_data[order]
+    
+    def _plot_velocity_points(self, ax, x_data, y_data, label: Optional[str] = None):
+        """Draw velocity vs wOBA on ax as a full scatter or as binned means, depending on full_resolution."""
+        if self.full_resolution:
+            ax.scatter(x_data, y_data, alpha=0.4 if label else 0.6, label=label)
+        else:
+            centers, means = binned_means(x_data, y_data)
+            ax.plot(centers, means, marker='o', markersize=3, linestyle='-', alpha=0.6,
+                    label=f'{label} (binned mean)' if label else None)
     
     def analyze_pitcher(self, player_name: str, start_year: int, end_year: int, 
-                       pitch_type: str = 'FF') -> Optional[pd.DataFrame]:
+                       pitch_type: str = 'FF',
+                       columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
         """
         Analyze a pitcher's velocity cliff.
         
@@ -29,6 +180,8 @@ class VelocityCliffAnalyzer:
             start_year (int): Starting year for analysis
             end_year (int): Ending year for analysis
             pitch_type (str): Pitch type to analyze (default: 'FF' for fastball)
+            columns (Optional[List[str]]): Extra columns to load alongside
+                VELOCITY_ANALYSIS_COLS, the columns the analysis uses (default: none)
             
         Returns:
             Optional[pd.DataFrame]: Prepared data for analysis
@@ -41,10 +194,23 @@ class VelocityCliffAnalyzer:
         
         first_name, last_name = name_parts[0], name_parts[-1]
         
-        # Get pitcher data
-        pitcher_data = self.data_pipeline.get_pitcher_data_by_name(
-            first_name, last_name, start_year, end_year
+        player_id = self.data_pipeline.find_player_by_name(first_name, last_name)
+        if player_id is None:
+            self.logger.error(f"Player not found: {player_name}")
+            return None
+        
+        # Get the pitcher's pitches of this type, reading only the columns the analysis needs
+        # plus any the caller asked for. The pitch type is filtered in Arrow before pandas, and
+        # the per-pitcher aggregate answers the query without touching the season files when
+        # it is built and current.
+        columns = VELOCITY_ANALYSIS_COLS + [c for c in columns or [] if c not in VELOCITY_ANALYSIS_COLS]
+        pitcher_data = self.data_pipeline.get_pitcher_agg_data(
+            player_id, start_year, end_year, columns, pitch_type
         )
+        if pitcher_data is None:
+            pitcher_data = self.data_pipeline.get_player_data(
+                player_id, start_year, end_year, columns, pitch_type
+            )
         
         if len(pitcher_data) == 0:
             self.logger.error(f"No data found for {player_name}")
@@ -57,121 +223,139 @@ class VelocityCliffAnalyzer:
         
         return analysis_data
     
-    def plot_pitch_summary(self, player_data: pd.DataFrame, player_name: str):
+    def plot_pitch_summary(self, player_data: pd.DataFrame, player_name: str, axes=None):
         """
         Plot pitch type summary statistics.
         
         Args:
             player_data (pd.DataFrame): Player data
             player_name (str): Player name for title
+            axes: Four matplotlib Axes to draw into; the caller lays out and shows
+                their figure (default: draw and show a figure of its own)
         """
+        import matplotlib.pyplot as plt
+        
         summary = self.data_pipeline.get_pitch_summary(player_data)
         
-        plt.figure(figsize=(12, 8))
+        fig = None
+        if axes is None:
+            fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+            axes = axes.ravel()
         
         # Plot velocity by pitch type
-        plt.subplot(2, 2, 1)
+        ax = axes[0]
         velocity_means = summary['release_speed_mean']
-        velocity_means.plot(kind='bar')
-        plt.title('Average Velocity by Pitch Type')
-        plt.ylabel('Velocity (mph)')
-        plt.xticks(rotation=45)
+        velocity_means.plot(kind='bar', ax=ax)
+        ax.set_title('Average Velocity by Pitch Type')
+        ax.set_ylabel('Velocity (mph)')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Plot wOBA by pitch type
-        plt.subplot(2, 2, 2)
+        ax = axes[1]
         woba_means = summary['estimated_woba_using_speedangle_mean']
-        woba_means.plot(kind='bar')
-        plt.title('Average wOBA by Pitch Type')
-        plt.ylabel('wOBA')
-        plt.xticks(rotation=45)
+        woba_means.plot(kind='bar', ax=ax)
+        ax.set_title('Average wOBA by Pitch Type')
+        ax.set_ylabel('wOBA')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Plot pitch count by type
-        plt.subplot(2, 2, 3)
+        ax = axes[2]
         pitch_counts = summary['release_speed_count']
-        pitch_counts.plot(kind='bar')
-        plt.title('Pitch Count by Type')
-        plt.ylabel('Number of Pitches')
-        plt.xticks(rotation=45)
+        pitch_counts.plot(kind='bar', ax=ax)
+        ax.set_title('Pitch Count by Type')
+        ax.set_ylabel('Number of Pitches')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Plot velocity vs wOBA scatter
-        plt.subplot(2, 2, 4)
-        plt.scatter(summary['release_speed_mean'], summary['estimated_woba_using_speedangle_mean'])
-        plt.xlabel('Average Velocity (mph)')
-        plt.ylabel('Average wOBA')
-        plt.title('Velocity vs wOBA by Pitch Type')
-        
-        plt.tight_layout()
-        plt.suptitle(f'{player_name} - Pitch Summary', y=1.02)
-        plt.show()
+        ax = axes[3]
+        ax.scatter(summary['release_speed_mean'], summary['estimated_woba_using_speedangle_mean'])
+        ax.set_xlabel('Average Velocity (mph)')
+        ax.set_ylabel('Average wOBA')
+        ax.set_title('Velocity vs wOBA by Pitch Type')
+        
+        if fig is not None:
+            fig.tight_layout()
+            fig.suptitle(f'{player_name} - Pitch Summary', y=1.02)
+            plt.show()
     
-    def plot_velocity_woba_relationship(self, fastball_data: pd.DataFrame, player_name: str):
+    def plot_velocity_woba_relationship(self, fastball_data: pd.DataFrame, player_name: str, ax=None):
         """
         Plot velocity vs wOBA relationship for fastballs.
         
         Args:
             fastball_data (pd.DataFrame): Fastball data
             player_name (str): Player name for title
+            ax: matplotlib Axes to draw into; the caller shows its figure
+                (default: draw and show a figure of its own)
         """
-        plt.figure(figsize=(10, 6))
+        import matplotlib.pyplot as plt
+        
+        show = ax is None
+        if show:
+            _, ax = plt.subplots(figsize=(10, 6))
         
         x_column = 'release_speed'
         y_column = 'estimated_woba_using_speedangle'
         
-        plt.scatter(fastball_data[x_column], fastball_data[y_column], alpha=0.6)
-        plt.xlabel('Release Speed (mph)')
-        plt.ylabel('Estimated wOBA')
-        plt.title(f'{player_name} - Velocity vs wOBA (Fastballs)')
-        plt.grid(True)
-        plt.show()
+        self._plot_velocity_points(ax, fastball_data[x_column], fastball_data[y_column])
+        ax.set_xlabel('Release Speed (mph)')
+        ax.set_ylabel('Estimated wOBA')
+        ax.set_title(f'{player_name} - Velocity vs wOBA (Fastballs)')
+        ax.grid(True)
+        if show:
+            plt.show()
     
-    def perform_cusum_analysis(self, fastball_data: pd.DataFrame, player_name: str, generate_plots: bool = True) -> float:
+    def perform_cusum_analysis(self, fastball_data: Union[pd.DataFrame, VelocityArrays],
+                               player_name: str, generate_plots: bool = True, axes=None) -> float:
         """
         Perform CUSUM analysis to detect velocity threshold.
         
         Args:
-            fastball_data (pd.DataFrame): Fastball data
+            fastball_data (Union[pd.DataFrame, VelocityArrays]): Fastball data
             player_name (str): Player name for title
+            axes: Two matplotlib Axes to plot into; the caller shows their figure
+                (default: plot in a figure of its own)
             
         Returns:
             float: Detected velocity threshold
         """
-        x_column = 'release_speed'
-        y_column = 'estimated_woba_using_speedangle'
-        
         # Sort by velocity
-        fastball_data_sorted = fastball_data.sort_values(by=x_column).reset_index(drop=True)
-        
-        x_data = fastball_data_sorted[x_column]
-        y_data = fastball_data_sorted[y_column]
+        x_data, y_data = self._sorted_velocity_woba(fastball_data)
         
         # Compute rolling mean to smooth fluctuations
         window_size = 10
-        y_smoothed = y_data.rolling(window=window_size, center=True, min_periods=1).mean()
+        y_smoothed = centered_rolling_mean(y_data, window_size)
         
         # Compute target value (baseline wOBA)
-        target = y_smoothed.mean()
-        
-        # Compute deviations from target
-        deviations = y_smoothed - target
+        target = np.nanmean(y_smoothed)
         
         # Set CUSUM parameters
         k = 0.005  # Drift parameter
         h = 0.02   # Decision threshold
         
-        # Compute CUSUM with one-sided detection
-        cusum = np.maximum(0, np.cumsum(deviations - k))
+        # Compute CUSUM with one-sided detection on the deviations from target,
+        # skipping empty windows in the running sum as pandas did
+        deviations = y_smoothed - (target + k)
+        cusum = np.nancumsum(deviations)
+        cusum[np.isnan(deviations)] = np.nan
+        cusum = np.maximum(0, cusum)
         
         # Identify velocity threshold
         threshold_idx = np.argmax(cusum)
-        velocity_threshold = x_data.iloc[threshold_idx]
+        # A Python float, rounded so the float32 samples don't show representation noise
+        velocity_threshold = round(float(x_data[threshold_idx]), 3)
         
         # Plot results (if requested)
         if generate_plots:
-            plt.figure(figsize=(12, 8))
+            import matplotlib.pyplot as plt
+            
+            fig = None
+            if axes is None:
+                fig, axes = plt.subplots(2, 1, figsize=(12, 8))
             
             # Plot 1: Scatter plot with LOWESS smoothing
-            plt.subplot(2, 1, 1)
-            plt.scatter(x_data, y_data, alpha=0.4, label='Raw Data')
+            ax = axes[0]
+            self._plot_velocity_points(ax, x_data, y_data, label='Raw Data')
             
             # Add LOWESS smoothing
             try:
@@ -179,127 +363,125 @@ class VelocityCliffAnalyzer:
                 lowess_frac = 0.2
                 lowess_fit = lowess(y_data, x_data, frac=lowess_frac)
                 x_lowess, y_lowess = zip(*lowess_fit)
-                plt.plot(x_lowess, y_lowess, color='orange', linewidth=2, label='LOWESS Smoothing')
+                ax.plot(x_lowess, y_lowess, color='orange', linewidth=2, label='LOWESS Smoothing')
             except ImportError:
                 self.logger.warning("statsmodels not available, skipping LOWESS smoothing")
             
-            plt.axhline(target, color='red', linestyle='--', label='Baseline wOBA')
-            plt.axvline(velocity_threshold, color='purple', linestyle='--', 
+            ax.axhline(target, color='red', linestyle='--', label='Baseline wOBA')
+            ax.axvline(velocity_threshold, color='purple', linestyle='--', 
                        label=f'Velocity Threshold: {velocity_threshold:.1f} mph')
-            plt.xlabel('Release Speed (mph)')
-            plt.ylabel('Estimated wOBA')
-            plt.title(f'{player_name} - Velocity vs wOBA Analysis')
-            plt.legend()
-            plt.grid(True)
+            ax.set_xlabel('Release Speed (mph)')
+            ax.set_ylabel('Estimated wOBA')
+            ax.set_title(f'{player_name} - Velocity vs wOBA Analysis')
+            ax.legend()
+            ax.grid(True)
             
             # Plot 2: CUSUM analysis
-            plt.subplot(2, 1, 2)
-            plt.plot(x_data, cusum, label='CUSUM', color='blue')
-            plt.axhline(h, color='green', linestyle='--', label='CUSUM Decision Threshold')
-            plt.axvline(velocity_threshold, color='purple', linestyle='--', 
+            ax = axes[1]
+            ax.plot(x_data, cusum, label='CUSUM', color='blue')
+            ax.axhline(h, color='green', linestyle='--', label='CUSUM Decision Threshold')
+            ax.axvline(velocity_threshold, color='purple', linestyle='--', 
                        label=f'Velocity Threshold: {velocity_threshold:.1f} mph')
-            plt.xlabel('Release Speed (mph)')
-            plt.ylabel('Cumulative Sum')
-            plt.title('CUSUM Analysis for Performance Decline Detection')
-            plt.legend()
-            plt.grid(True)
+            ax.set_xlabel('Release Speed (mph)')
+            ax.set_ylabel('Cumulative Sum')
+            ax.set_title('CUSUM Analysis for Performance Decline Detection')
+            ax.legend()
+            ax.grid(True)
             
-            plt.tight_layout()
-            plt.show()
+            if fig is not None:
+                fig.tight_layout()
+                plt.show()
         
         self.logger.info(f"Detected performance decline at velocity: {velocity_threshold:.1f} mph")
         return velocity_threshold
     
-    def perform_bayesian_changepoint_analysis(self, fastball_data: pd.DataFrame, 
-                                            player_name: str, generate_plots: bool = True) -> float:
+    def perform_bayesian_changepoint_analysis(self, fastball_data: Union[pd.DataFrame, VelocityArrays, VelocityBuckets], 
+                                            player_name: str, generate_plots: bool = True,
+                                            method: str = 'exact', ax=None) -> float:
         """
         Perform Bayesian changepoint analysis.
         
         Args:
-            fastball_data (pd.DataFrame): Fastball data
+            fastball_data (Union[pd.DataFrame, VelocityArrays, VelocityBuckets]): Fastball data.
+                VelocityBuckets are searched bucket by bucket, weighted by pitch count.
             player_name (str): Player name for title
+            method (str): 'exact' scans every candidate for the posterior mode;
+                'mcmc' estimates it by Metropolis sampling (default: 'exact')
+            ax: matplotlib Axes to plot into; the caller shows its figure
+                (default: plot in a figure of its own)
             
         Returns:
             float: Detected velocity threshold
         """
-        x_column = 'release_speed'
-        y_column = 'estimated_woba_using_speedangle'
-        
-        # Sort by velocity
-        fastball_data_sorted = fastball_data.sort_values(by=x_column).reset_index(drop=True)
-        
-        x_data = fastball_data_sorted[x_column].values
-        y_data = fastball_data_sorted[y_column].values
-        
-        # Smooth fluctuations
-        window_size = 10
-        y_smoothed = pd.Series(y_data).rolling(window=window_size, center=True, min_periods=1).mean()
-        
-        # Bayesian changepoint detection
-        import scipy.stats as stats
-        
-        def log_likelihood(y, mu1, mu2, sigma, cp):
-            """Compute log-likelihood given a change point"""
-            n1, n2 = cp, len(y) - cp
-            log_lik1 = np.sum(stats.norm.logpdf(y[:n1], mu1, sigma))
-            log_lik2 = np.sum(stats.norm.logpdf(y[n1:], mu2, sigma))
-            return log_lik1 + log_lik2
-        
-        def bayesian_changepoint(y, n_samples=5000):
-            """Use MCMC to estimate change point"""
-            n = len(y)
-            cp_samples = []
-            
-            # Initialize parameters
-            cp = n // 2
-            mu1, mu2 = np.mean(y[:cp]), np.mean(y[cp:])
-            sigma = np.std(y)
+        if isinstance(fastball_data, VelocityBuckets):
+            # Buckets are already means, so weight them by pitch count instead of smoothing
+            x_data, y_data = fastball_data.velocity, fastball_data.woba
+            weights = fastball_data.count
+            y_smoothed = y_data
+        else:
+            # Sort by velocity
+            x_data, y_data = self._sorted_velocity_woba(fastball_data)
+            weights = None
             
-            for _ in range(n_samples):
-                # Propose new changepoint
-                cp_new = np.random.randint(5, n-5)  # Avoid edges
-                
-                # Compute likelihoods
-                mu1_new, mu2_new = np.mean(y[:cp_new]), np.mean(y[cp_new:])
-                log_lik_old = log_likelihood(y, mu1, mu2, sigma, cp)
-                log_lik_new = log_likelihood(y, mu1_new, mu2_new, sigma, cp_new)
-                
-                # Compute acceptance probability
-                alpha = np.exp(log_lik_new - log_lik_old)
-                if np.random.rand() < alpha:
-                    cp = cp_new
-                    mu1, mu2 = mu1_new, mu2_new
-                
-                cp_samples.append(cp)
-            
-            # Return most frequent change point
-            return np.bincount(cp_samples).argmax()
-        
-        # Run Bayesian changepoint detection
-        change_point_index = bayesian_changepoint(y_smoothed)
-        change_point_value = x_data[change_point_index]
+            # Smooth fluctuations
+            window_size = 10
+            y_smoothed = centered_rolling_mean(y_data, window_size)
+        
+        # Bayesian changepoint detection on prefix sums of the (weighted) smoothed values.
+        # Centering first keeps the SSE = sum(y^2) - sum(y)^2 / n differences well conditioned.
+        y = np.asarray(y_smoothed, dtype=np.float64)
+        w = np.ones(len(y)) if weights is None else np.asarray(weights, dtype=np.float64)
+        y = y - np.average(y, weights=w)
+        sigma = np.sqrt(np.average(y ** 2, weights=w))
+        cw = np.concatenate(([0.0], np.cumsum(w)))
+        cs = np.concatenate(([0.0], np.cumsum(w * y)))
+        cs2 = np.concatenate(([0.0], np.cumsum(w * y * y)))
+        
+        # Avoid edges (bucketed searches can have few candidates)
+        edge = 5 if len(y) > 10 else 1
+        
+        if method == 'exact':
+            change_point_index = _exact_changepoint(cw, cs, cs2, edge)
+        elif method == 'mcmc':
+            # Draw every proposal and acceptance test up front, seeding from the global
+            # generator so np.random.seed() still makes runs repeatable
+            n_samples = 5000
+            rng = np.random.default_rng(np.random.randint(2 ** 31 - 1))
+            proposals = rng.integers(edge, len(y) - edge, size=n_samples)
+            log_uniforms = np.log(rng.random(n_samples))
+            change_point_index = _compiled_bayesian_changepoint()(cw, cs, cs2, sigma, proposals, log_uniforms)
+        else:
+            raise ValueError(f"Unknown changepoint method: {method}")
+        # A Python float, rounded so the float32 samples don't show representation noise
+        change_point_value = round(float(x_data[change_point_index]), 3)
         
         # Plot results (if requested)
         if generate_plots:
-            plt.figure(figsize=(12, 6))
+            import matplotlib.pyplot as plt
             
-            plt.scatter(x_data, y_data, alpha=0.4, label='Raw Data')
-            plt.plot(x_data, y_smoothed, color='orange', linewidth=2, label='Smoothed wOBA')
-            plt.axvline(change_point_value, color='red', linestyle='--', 
+            show = ax is None
+            if show:
+                _, ax = plt.subplots(figsize=(12, 6))
+            
+            self._plot_velocity_points(ax, x_data, y_data, label='Raw Data')
+            ax.plot(x_data, y_smoothed, color='orange', linewidth=2, label='Smoothed wOBA')
+            ax.axvline(change_point_value, color='red', linestyle='--', 
                        label=f'Change Point: {change_point_value:.1f} mph')
             
-            plt.xlabel('Release Speed (mph)')
-            plt.ylabel('Estimated wOBA')
-            plt.title(f'{player_name} - Bayesian Change Point Detection')
-            plt.legend()
-            plt.grid(True)
-            plt.show()
+            ax.set_xlabel('Release Speed (mph)')
+            ax.set_ylabel('Estimated wOBA')
+            ax.set_title(f'{player_name} - Bayesian Change Point Detection')
+            ax.legend()
+            ax.grid(True)
+            if show:
+                plt.show()
         
         self.logger.info(f"Detected velocity change point: {change_point_value:.1f} mph")
         return change_point_value
     
     def run_full_analysis(self, player_name: str, start_year: int, end_year: int, 
-                         pitch_type: str = 'FF', generate_plots: bool = True) -> dict:
+                         pitch_type: str = 'FF', generate_plots: bool = True,
+                         columns: Optional[List[str]] = None, bucketize: bool = False) -> dict:
         """
         Run complete velocity cliff analysis.
         
@@ -308,7 +490,12 @@ class VelocityCliffAnalyzer:
             start_year (int): Starting year
             end_year (int): Ending year
             pitch_type (str): Pitch type to analyze
-            generate_plots (bool): Whether to generate and display plots
+            generate_plots (bool): Whether to generate and display plots, drawn
+                together in one 4 x 2 figure
+            columns (Optional[List[str]]): Extra columns to load alongside
+                VELOCITY_ANALYSIS_COLS, the columns the analysis uses (default: none)
+            bucketize (bool): Run the Bayesian search over 0.1 mph velocity buckets
+                instead of individual pitches (default: False)
             
         Returns:
             dict: Analysis results
@@ -316,30 +503,52 @@ class VelocityCliffAnalyzer:
         self.logger.info(f"Starting velocity cliff analysis for {player_name} ({start_year}-{end_year})")
         
         # Get pitcher data
-        pitcher_data = self.analyze_pitcher(player_name, start_year, end_year, pitch_type)
+        pitcher_data = self.analyze_pitcher(player_name, start_year, end_year, pitch_type, columns)
         
         if pitcher_data is None or len(pitcher_data) == 0:
             return {'error': 'No data found for player'}
         
-        # Plot pitch summary (if requested)
+        # Draw every plot into one figure (if requested): the pitch summary in the
+        # top two rows, then velocity vs wOBA, Bayesian and CUSUM panels
+        axes = None
         if generate_plots:
-            self.plot_pitch_summary(pitcher_data, player_name)
+            import matplotlib.pyplot as plt
+            
+            fig, axes = plt.subplots(4, 2, figsize=(14, 20))
+            self.plot_pitch_summary(pitcher_data, player_name, axes=axes[:2].ravel())
         
         # Get fastball data
         fastball_data = self.data_pipeline.get_pitch_type_data(pitcher_data, pitch_type)
         
         if len(fastball_data) == 0:
+            if generate_plots:
+                plt.close(fig)
             return {'error': f'No {pitch_type} data found'}
         
         # Plot velocity vs wOBA relationship (if requested)
         if generate_plots:
-            self.plot_velocity_woba_relationship(fastball_data, player_name)
+            self.plot_velocity_woba_relationship(fastball_data, player_name, ax=axes[2, 0])
         
         # Perform CUSUM analysis
-        cusum_threshold = self.perform_cusum_analysis(fastball_data, player_name, generate_plots)
+        cusum_threshold = self.perform_cusum_analysis(
+            fastball_data, player_name, generate_plots, axes=None if axes is None else axes[3]
+        )
         
         # Perform Bayesian changepoint analysis
-        bayesian_threshold = self.perform_bayesian_changepoint_analysis(fastball_data, player_name, generate_plots)
+        if bucketize:
+            bayesian_data = self.data_pipeline.prepare_velocity_analysis_data(
+                fastball_data, pitch_type, bucketize=True
+            )
+        else:
+            bayesian_data = fastball_data
+        bayesian_threshold = self.perform_bayesian_changepoint_analysis(
+            bayesian_data, player_name, generate_plots, ax=None if axes is None else axes[2, 1]
+        )
+        
+        if generate_plots:
+            fig.suptitle(f'{player_name} - Velocity Cliff Analysis ({start_year}-{end_year})')
+            fig.tight_layout(rect=(0, 0, 1, 0.98))
+            plt.show()
         
         # Compile results
         results = {
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Build the per-pitcher aggregate read by VelocityCliffAnalyzer.analyze_pitcher.
+
+The analysis only ever reads a few columns of one pitcher's rows. This writes
+those columns (PITCHER_AGG_COLS) for every season into a Hive-partitioned
+parquet dataset at data/pitcher_agg/pitcher=ID/, one small directory per
+pitcher, so an analysis reads a few hundred KB instead of filtering every
+season file. Rerun it after adding or replacing season files; until then the
+analyzer falls back to the season files for the affected years.
+
+Usage:
+    python utils/build_pitcher_agg.py --data-dir data
+"""
+
+import os
+import re
+import shutil
+import argparse
+import logging
+import pyarrow as pa
+import pyarrow.dataset as ds
+from SeasonFiles import list_season_files
+from DataPipeline import PITCHER_AGG_COLS
+
+PITCHER_AGG_PARTITIONING = ds.partitioning(pa.schema([('pitcher', pa.int64())]), flavor='hive')
+
+# Column types in data/pitcher_agg (float64 unless listed); seasons that disagree are cast to these
+_AGG_TYPES = {'game_year': pa.int64(), 'pitch_type': pa.string()}
+PITCHER_AGG_SCHEMA = pa.schema(
+    [('pitcher', pa.int64())] + [(c, _AGG_TYPES.get(c, pa.float64())) for c in PITCHER_AGG_COLS]
+)
+
+def read_season_projection(path: str) -> pa.Table:
+    """Read the aggregate columns of a season file, with nulls for any it lacks."""
+    season = ds.dataset(path, format='feather')
+    names = set(season.schema.names)
+    table = season.to_table(columns=[c for c in PITCHER_AGG_SCHEMA.names if c in names])
+    columns = []
+    for field in PITCHER_AGG_SCHEMA:
+        if field.name in names:
+            column = table[field.name]
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            columns.append(column.cast(field.type))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(columns, schema=PITCHER_AGG_SCHEMA)
+
+def build_pitcher_agg(data_dir: str, compression_level: int = 6):
+    """Rebuild data_dir/pitcher_agg from the season feather files, replacing it as a whole."""
+    season_dir = os.path.join(data_dir, 'savant', 'season_data')
+    out_dir = os.path.join(data_dir, 'pitcher_agg')
+    tmp_dir = out_dir + '.part'
+    if os.path.isdir(tmp_dir):
+        shutil.rmtree(tmp_dir)
+
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression='zstd', compression_level=compression_level
+    )
+    seasons = list_season_files(season_dir) if os.path.isdir(season_dir) else []
+    if not seasons:
+        logging.error(f"No season files found under {season_dir}")
+        return
+
+    try:
+        for name, _ in seasons:
+            year = int(re.match(r'\d{4}', name).group())
+            table = read_season_projection(os.path.join(season_dir, name))
+            # One file per season in each pitcher's directory
+            ds.write_dataset(table, tmp_dir, format='parquet', partitioning=PITCHER_AGG_PARTITIONING,
+                             basename_template=f'{year}-{{i}}.parquet', file_options=file_options,
+                             existing_data_behavior='overwrite_or_ignore', max_partitions=100_000)
+            logging.info(f"{name}: {table.num_rows} pitches")
+            del table
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    os.replace(tmp_dir, out_dir)
+    logging.info(f"Wrote {len(os.listdir(out_dir))} pitcher partitions to {out_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the per-pitcher aggregate used by the velocity cliff analysis')
+    parser.add_argument('--data-dir', default='data', help='Data directory (default: data)')
+    parser.add_argument('--level', type=int, default=6, help='Zstd compression level (default: 6)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    build_pitcher_agg(args.data_dir, args.level)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+One-time migration of the local data files to Zstd-compressed Feather V2.
+
+Older downloads were written as uncompressed (or Feather V1) files with plain
+string columns. This rewrites player_meta.feather and every season file in
+place with Zstd compression and dictionary-encoded low-cardinality string
+columns. DataPipeline reads both layouts, so the migration is optional.
+
+With --parquet, each season is also written as {year}.parquet sorted by
+pitcher in small row groups, so a single-pitcher query only reads the row
+groups whose pitcher statistics match. DataPipeline and player_lookup prefer
+the parquet file when both exist.
+
+With --by-pitcher, each season is also written into a Hive-partitioned
+parquet dataset at savant/by_pitcher/year=YYYY/pitcher=ID/, so player_lookup
+reads a single partition directory instead of filtering whole seasons.
+
+Usage:
+    python utils/migrate_feather.py --data-dir data
+    python utils/migrate_feather.py --data-dir data --parquet
+    python utils/migrate_feather.py --data-dir data --by-pitcher
+"""
+
+import os
+import re
+import shutil
+import argparse
+import logging
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import feather
+from SeasonFiles import list_season_files
+from PlayerLookup import BY_PITCHER_PARTITIONING, by_pitcher_dir
+
+# String columns with fewer distinct values than this are dictionary-encoded
+DICTIONARY_MAX_VALUES = 2048
+
+# Rows per parquet row group; small enough that most pitchers span only one or two
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+def encode_string_columns(table: pa.Table) -> pa.Table:
+    """Dictionary-encode the low-cardinality string columns of `table`."""
+    for index, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        column = table.column(index)
+        if pc.count_distinct(column).as_py() < DICTIONARY_MAX_VALUES:
+            table = table.set_column(index, field.name, pc.dictionary_encode(column))
+    return table
+
+def migrate_file(path: str, compression_level: int = 6, encode_strings: bool = True):
+    """Rewrite a feather file as Zstd-compressed Feather V2, replacing it atomically."""
+    table = feather.read_table(path)
+    if encode_strings:
+        table = encode_string_columns(table)
+    tmp_path = path + '.part'
+    try:
+        feather.write_feather(table, tmp_path, compression='zstd',
+                              compression_level=compression_level)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    old_size = os.path.getsize(path)
+    os.replace(tmp_path, path)
+    new_size = os.path.getsize(path)
+    logging.info(f"{os.path.basename(path)}: {old_size / (1024 * 1024):.1f}MB -> "
+                 f"{new_size / (1024 * 1024):.1f}MB")
+
+def write_parquet_season(path: str, compression_level: int = 6):
+    """Write a pitcher-sorted {year}.parquet next to a season feather file."""
+    table = feather.read_table(path).sort_by('pitcher')
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    tmp_path = parquet_path + '.part'
+    try:
+        pq.write_table(table, tmp_path, row_group_size=PARQUET_ROW_GROUP_SIZE,
+                       use_dictionary=True, compression='zstd',
+                       compression_level=compression_level)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, parquet_path)
+    logging.info(f"{os.path.basename(parquet_path)}: "
+                 f"{os.path.getsize(parquet_path) / (1024 * 1024):.1f}MB")
+
+def write_pitcher_partitions(path: str, compression_level: int = 6):
+    """Write a season feather file into the year=YYYY/pitcher=ID partitioned dataset."""
+    year = int(re.match(r'\d{4}', os.path.basename(path)).group())
+    base_dir = by_pitcher_dir(os.path.dirname(path))
+    year_dir = os.path.join(base_dir, f'year={year}')
+
+    table = feather.read_table(path)
+    table = table.append_column('year', pa.array(np.full(table.num_rows, year, dtype=np.int16)))
+
+    # Replace the whole year so pitchers dropped from the season file don't linger
+    if os.path.isdir(year_dir):
+        shutil.rmtree(year_dir)
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression='zstd', compression_level=compression_level
+    )
+    ds.write_dataset(table, base_dir, format='parquet', partitioning=BY_PITCHER_PARTITIONING,
+                     file_options=file_options, existing_data_behavior='overwrite_or_ignore',
+                     max_partitions=100_000)
+    logging.info(f"{os.path.basename(path)}: "
+                 f"{len(pc.unique(table['pitcher']))} pitcher partitions in {year_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Rewrite local feather files as Zstd-compressed Feather V2')
+    parser.add_argument('--data-dir', default='data', help='Data directory (default: data)')
+    parser.add_argument('--level', type=int, default=6, help='Zstd compression level (default: 6)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also write pitcher-sorted {year}.parquet season files')
+    parser.add_argument('--by-pitcher', action='store_true',
+                        help='Also write the year/pitcher partitioned parquet dataset')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # Player names are lookup keys, so only the season files get dictionary columns
+    paths = []
+    player_meta_path = os.path.join(args.data_dir, 'player_meta.feather')
+    if os.path.exists(player_meta_path):
+        paths.append((player_meta_path, False))
+
+    season_dir = os.path.join(args.data_dir, 'savant', 'season_data')
+    if os.path.isdir(season_dir):
+        paths.extend((os.path.join(season_dir, name), True) for name, _ in list_season_files(season_dir))
+
+    if not paths:
+        logging.error(f"No feather files found under {args.data_dir}")
+        return
+
+    for path, encode_strings in paths:
+        try:
+            migrate_file(path, args.level, encode_strings)
+            if args.parquet and path != player_meta_path:
+                write_parquet_season(path, args.level)
+            if args.by_pitcher and path != player_meta_path:
+                write_pitcher_partitions(path, args.level)
+        except Exception as e:
+            logging.error(f"Error migrating {path}: {e}")
+
+if __name__ == "__main__":
+    main()
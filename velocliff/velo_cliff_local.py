@@ -15,7 +15,6 @@ Usage:
 import sys
 import os
 import argparse
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from typing import Optional, Tuple